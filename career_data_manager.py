@@ -4,22 +4,39 @@ Career Data Manager - Local storage for Resume Tailor.
 Handles all file I/O operations for career data with:
 - Pydantic validation
 - In-memory caching with timestamp invalidation
-- Atomic writes (temp file + rename)
+- Atomic writes (temp file + rename) - a failed save never touches the original
 - Automatic backup before each write
-- Rollback capability on failure
+- Manual restore from backup
 
 Replaces supermemory dependency with privacy-first local JSON storage.
 """
 
+import hashlib
 import json
 import os
 import shutil
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
-from pydantic import ValidationError
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
-from models import CareerData, ContactInfo
+# Pydantic and the models are imported lazily inside load()/save(), so
+# callers that only need paths or backup checks (e.g. GUI startup) don't
+# pay Pydantic's import cost.
+if TYPE_CHECKING:
+    from models import CareerData
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False  # Fall back to stdlib json
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False  # Fall back to hashlib.blake2b
 
 
 class CareerDataError(Exception):
@@ -39,10 +56,32 @@ class CareerDataFileError(CareerDataError):
     pass
 
 
+def _dump_json(document: Dict[str, Any]) -> bytes:
+    """Serialize a model_dump(mode='json') document to indented UTF-8 bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(document, option=orjson.OPT_INDENT_2)
+    return json.dumps(document, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes (orjson if available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _hash_payload(payload: bytes) -> bytes:
+    """Fast content digest used to detect saves that wouldn't change the file."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_digest(payload)
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
 class CareerDataManager:
     """Manages local career data with caching, validation, and backup."""
 
-    def __init__(self, file_path: Path, backup_enabled: bool = True, cache_enabled: bool = True):
+    def __init__(self, file_path: Path, backup_enabled: bool = True, cache_enabled: bool = True,
+                 stat_ttl: float = 0.0, durable: bool = True):
         """
         Initialize career data manager.
 
@@ -50,19 +89,49 @@ class CareerDataManager:
             file_path: Path to career_data.json file
             backup_enabled: Whether to create .bak file before each write
             cache_enabled: Whether to use in-memory caching
+            stat_ttl: Seconds to trust the cache without re-checking the file's
+                mtime. 0 (default) checks on every load; only raise it when
+                this manager is the sole writer of the file.
+            durable: Whether to fsync the data file and its directory on save.
+                Writes stay atomic either way; turn this off only for
+                throwaway data (demos, tests).
         """
-        self.file_path = Path(file_path)
         self.backup_enabled = backup_enabled
         self.cache_enabled = cache_enabled
+        self.stat_ttl = stat_ttl
+        self.durable = durable
 
-        # Cache state
-        self._cache: Optional[CareerData] = None
-        self._cache_timestamp: Optional[float] = None
+        # Sets the cached path strings and resets cache/write state below
+        self.file_path = file_path
 
         # Ensure parent directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def load(self) -> CareerData:
+    @property
+    def file_path(self) -> Path:
+        """Path to the career data file."""
+        return self._file_path
+
+    @file_path.setter
+    def file_path(self, value: Path):
+        """Point the manager at a (new) file; cache and write state are reset."""
+        self._file_path = Path(value)
+
+        # Plain str paths for the hot os.* calls (skips pathlib overhead)
+        self._file_path_str = os.fspath(self._file_path)
+        self._temp_path_str = os.fspath(self._file_path.with_suffix('.tmp'))
+        self._backup_path = self._file_path.with_suffix('.json.bak')
+
+        # Cache state
+        self._cache: Optional['CareerData'] = None
+        self._cache_timestamp: Optional[float] = None
+        self._last_stat_wall = 0.0  # time.monotonic() of last confirmed-valid check
+
+        # Last write state (skips rewriting byte-identical content)
+        self._last_saved_hash: Optional[bytes] = None
+        self._last_saved_mtime_ns: Optional[int] = None
+
+    def load(self) -> 'CareerData':
         """
         Load career data with caching and timestamp validation.
 
@@ -73,21 +142,23 @@ class CareerDataManager:
             FileError: If file cannot be read
             ValidationError: If data doesn't match schema
         """
-        # Check cache first
-        if self.cache_enabled and self._cache and self._is_cache_valid():
-            return self._cache
+        # Check cache first (hot path: one attribute read, no extra calls on a miss)
+        cache = self._cache
+        if cache is not None and self.cache_enabled and self._is_cache_valid():
+            return cache
 
         # File doesn't exist - create empty structure
         if not self.file_path.exists():
             return self._create_empty_career_data()
 
+        from pydantic import ValidationError
+
         # Load from file
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.file_path, 'rb') as f:
+                raw = f.read()
 
-            # Validate with Pydantic
-            career_data = CareerData(**data)
+            career_data = self._parse(raw)
 
             # Update cache
             if self.cache_enabled:
@@ -121,16 +192,38 @@ class CareerDataManager:
                             f"Check that the file exists and is readable."
             )
 
-    def save(self, data: CareerData) -> bool:
+    def _parse(self, raw: bytes) -> 'CareerData':
+        """
+        Parse and validate raw file contents into CareerData.
+
+        Parses and validates in a single Pydantic (Rust) pass. On failure,
+        re-parses with json + Pydantic so callers get the usual
+        JSONDecodeError (bad formatting) or ValidationError (bad data).
+        """
+        from pydantic import ValidationError
+        from models import CareerData
+
+        try:
+            return CareerData.model_validate_json(raw)
+        except ValidationError:
+            pass  # Slow path below produces the specific error
+
+        # Validate with Pydantic
+        return CareerData(**_load_json(raw))
+
+    def save(self, data: 'CareerData') -> bool:
         """
         Save career data with atomic write and backup.
 
+        Returns early without touching disk when the content is identical to
+        what this manager last wrote and the file hasn't changed since.
+
         Process:
-        1. Validate data with Pydantic
+        1. Serialize and validate data with Pydantic (before touching disk)
         2. Create backup (career_data.json.bak)
         3. Write to temp file (career_data.json.tmp)
-        4. Validate temp file can be read
-        5. Atomic rename (replaces original)
+        4. Write the full payload in raw os.write calls and fsync it
+        5. Atomic rename (replaces original) and fsync the parent directory
         6. Update cache timestamp
 
         Args:
@@ -143,31 +236,65 @@ class CareerDataManager:
             ValidationError: If data fails validation
             FileError: If write fails
         """
+        from pydantic import ValidationError
+        from models import CareerData
+
         try:
-            # 1. Validate data (Pydantic will raise if invalid)
+            # Nothing changed since our last save and nobody touched the file:
+            # skip backup, write, fsync and rename. Hashed before last_updated
+            # is stamped, so an unchanged document serializes identically.
+            document = data.model_dump(mode='json')
+            payload = _dump_json(document)
+            if _hash_payload(payload) == self._last_saved_hash and self._file_unchanged_since_save():
+                if self.cache_enabled:
+                    self._update_cache(data)
+                return True
+
+            # Stamp only real writes; patch the dumped document in place
+            # rather than dumping the whole model again
             data.last_updated = datetime.now()
+            document['last_updated'] = data.last_updated.isoformat()
+            payload = _dump_json(document)
 
-            # Convert to JSON-serializable dict
-            data_dict = json.loads(data.model_dump_json())
+            # 1. Validate exactly what will be written (catches in-place edits
+            #    made after construction). Pydantic will raise if invalid.
+            CareerData.model_validate_json(payload)
 
+        except ValidationError as e:
+            # Nothing has been written yet - the file on disk is untouched
+            raise CareerDataValidationError(
+                f"Save failed - data validation error: {e}",
+                user_message=f"Failed to save career data - validation error.\n\n"
+                            f"Your existing career data was not modified.\n\n"
+                            f"The data you tried to save doesn't match the expected format."
+            )
+
+        except Exception as e:
+            # Serialization failed (e.g. a non-JSON value appended in place);
+            # nothing has been written yet
+            raise CareerDataFileError(
+                f"Save failed: {e}",
+                user_message=f"Failed to save career data.\n\n"
+                            f"Error: {str(e)}\n\n"
+                            f"Your existing career data was not modified."
+            )
+
+        try:
             # 2. Create backup if file exists
-            if self.backup_enabled and self.file_path.exists():
+            if self.backup_enabled and os.path.exists(self._file_path_str):
                 self._create_backup()
 
-            # 3. Write to temp file
-            temp_path = self.file_path.with_suffix('.tmp')
+            # 3-4. Write the full payload to a temp file and fsync it
+            temp_path = self._temp_path_str
             try:
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    json.dump(data_dict, f, indent=2, ensure_ascii=False)
+                self._write_durable(temp_path, payload, sync=self.durable)
 
-                # 4. Validate temp file can be read
-                with open(temp_path, 'r', encoding='utf-8') as f:
-                    test_data = json.load(f)
-                    # Quick validation
-                    CareerData(**test_data)
-
-                # 5. Atomic rename
-                shutil.move(str(temp_path), str(self.file_path))
+                # 5. Atomic rename, then persist the directory entry
+                os.replace(temp_path, self._file_path_str)
+                if self.durable:
+                    self._fsync_parent_dir()
+                self._last_saved_hash = _hash_payload(payload)
+                self._last_saved_mtime_ns = os.stat(self._file_path_str).st_mtime_ns
 
                 # 6. Update cache
                 if self.cache_enabled:
@@ -177,72 +304,122 @@ class CareerDataManager:
 
             except Exception as e:
                 # Clean up temp file if it exists
-                if temp_path.exists():
-                    temp_path.unlink()
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
                 raise e
 
-        except ValidationError as e:
-            # Validation failed - restore from backup if available
-            if self.backup_enabled:
-                restored = self._restore_from_backup()
-                restore_msg = "Original data restored from backup." if restored else "No backup available to restore."
-            else:
-                restore_msg = "Backup disabled."
-
-            raise CareerDataValidationError(
-                f"Save failed - data validation error: {e}",
-                user_message=f"Failed to save career data - validation error.\n\n"
-                            f"{restore_msg}\n\n"
-                            f"The data you tried to save doesn't match the expected format."
-            )
-
         except Exception as e:
-            # Write failed - restore from backup if available
-            if self.backup_enabled:
-                restored = self._restore_from_backup()
-                restore_msg = "Original data restored from backup." if restored else "No backup available to restore."
-            else:
-                restore_msg = "Backup disabled."
-
+            # Write failed before the atomic rename, so the original file is
+            # intact - copying the backup over it would be wasted work (or
+            # worse, roll back to an older .bak if the backup step failed)
             raise CareerDataFileError(
                 f"Save failed: {e}",
                 user_message=f"Failed to save career data.\n\n"
                             f"Error: {str(e)}\n\n"
-                            f"{restore_msg}"
+                            f"Your existing career data was not modified."
             )
 
+    @staticmethod
+    def _write_durable(path: str, payload: bytes, sync: bool = True):
+        """
+        Write bytes to a file with unbuffered os.write calls and fsync it
+        (unless sync is False).
+
+        Skips the io layer entirely; the payload is already encoded, so a
+        single write syscall usually covers it (looping on short writes).
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(path, flags, 0o666)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            if sync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _fsync_parent_dir(self):
+        """Flush the parent directory so the rename survives a crash (POSIX only)."""
+        if os.name == 'nt':
+            return  # Directories can't be opened for fsync on Windows
+
+        # Best effort: the rename already happened, and some filesystems
+        # (e.g. network shares) reject fsync on directories
+        try:
+            dir_fd = os.open(self.file_path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+    def _file_unchanged_since_save(self) -> bool:
+        """Check the data file is still the one our last save() wrote."""
+        if self._last_saved_mtime_ns is None:
+            return False
+
+        try:
+            return os.stat(self._file_path_str).st_mtime_ns == self._last_saved_mtime_ns
+        except OSError:
+            return False
+
     def _is_cache_valid(self) -> bool:
         """Check if cached data is still valid (file hasn't changed)."""
-        if not self._cache or not self._cache_timestamp:
+        if self._cache is None or self._cache_timestamp is None:
             return False
 
-        if not self.file_path.exists():
+        # Checked recently enough - skip the stat() syscalls
+        if self.stat_ttl and time.monotonic() - self._last_stat_wall < self.stat_ttl:
+            return True
+
+        # Check if file was modified since cache (one stat; missing file = invalid)
+        try:
+            file_mtime = os.stat(self._file_path_str).st_mtime
+        except OSError:
+            return False
+        if file_mtime > self._cache_timestamp:
             return False
 
-        # Check if file was modified since cache
-        file_mtime = self.file_path.stat().st_mtime
-        return file_mtime <= self._cache_timestamp
+        self._last_stat_wall = time.monotonic()
+        return True
 
-    def _update_cache(self, data: CareerData):
+    def _update_cache(self, data: 'CareerData'):
         """Update cache with new data and timestamp."""
         self._cache = data
-        if self.file_path.exists():
-            self._cache_timestamp = self.file_path.stat().st_mtime
-        else:
+        try:
+            self._cache_timestamp = os.stat(self._file_path_str).st_mtime
+        except OSError:
             self._cache_timestamp = datetime.now().timestamp()
+        self._last_stat_wall = time.monotonic()
 
     def invalidate_cache(self):
         """Manually invalidate cache (useful for testing)."""
         self._cache = None
         self._cache_timestamp = None
+        self._last_stat_wall = 0.0
 
     def _create_backup(self):
-        """Create backup file (.bak)."""
+        """
+        Create backup file (.bak).
+
+        Hardlinks the current file instead of copying it. save() replaces the
+        data file with a new inode via os.replace, so the link keeps pointing
+        at the previous contents. Falls back to a copy where hardlinks aren't
+        supported (e.g. FAT32, some network shares).
+        """
         if not self.file_path.exists():
             return
 
-        backup_path = self.file_path.with_suffix('.json.bak')
-        shutil.copy2(self.file_path, backup_path)
+        backup_path = self._backup_path
+        try:
+            backup_path.unlink(missing_ok=True)
+            os.link(self.file_path, backup_path)
+        except OSError:
+            shutil.copy2(self.file_path, backup_path)
 
     def _restore_from_backup(self) -> bool:
         """
@@ -251,12 +428,18 @@ class CareerDataManager:
         Returns:
             True if restored successfully, False if no backup available
         """
-        backup_path = self.file_path.with_suffix('.json.bak')
+        backup_path = self._backup_path
 
         if not backup_path.exists():
             return False
 
         try:
+            # Backup is still hardlinked to the data file (a save was
+            # interrupted before the rename), so they already hold the same data
+            if self.file_path.exists() and os.path.samefile(backup_path, self.file_path):
+                self.invalidate_cache()
+                return True
+
             shutil.copy2(backup_path, self.file_path)
             # Invalidate cache since we restored old data
             self.invalidate_cache()
@@ -264,12 +447,17 @@ class CareerDataManager:
         except Exception:
             return False
 
-    def _create_empty_career_data(self) -> CareerData:
+    def _create_empty_career_data(self) -> 'CareerData':
         """
         Create empty career data structure and save it.
 
-        Uses default contact info from config.py if available.
+        Uses default contact info from config.py if available. The models are
+        built with model_construct since these defaults are trusted; save()
+        still validates the serialized document before writing it. Anything
+        user-provided goes through full CareerData(**data) validation.
         """
+        from models import CareerData, ContactInfo
+
         try:
             from config import get_contact_info
             contact = get_contact_info()
@@ -283,9 +471,9 @@ class CareerDataManager:
                 "location": "Your Location"
             }
 
-        career_data = CareerData(
+        career_data = CareerData.model_construct(
             version="1.0",
-            contact_info=ContactInfo(**contact),
+            contact_info=ContactInfo.model_construct(**contact),
             jobs=[],
             skills=[],
             education=[],
@@ -301,7 +489,7 @@ class CareerDataManager:
 
     def get_backup_path(self) -> Path:
         """Get backup file path."""
-        return self.file_path.with_suffix('.json.bak')
+        return self._backup_path
 
     def has_backup(self) -> bool:
         """Check if backup file exists."""
@@ -338,7 +526,7 @@ def get_manager() -> CareerDataManager:
     return _manager
 
 
-def load_career_data() -> CareerData:
+def load_career_data() -> 'CareerData':
     """
     Load career data (convenience function).
 
@@ -348,7 +536,7 @@ def load_career_data() -> CareerData:
     return get_manager().load()
 
 
-def save_career_data(data: CareerData) -> bool:
+def save_career_data(data: 'CareerData') -> bool:
     """
     Save career data (convenience function).
 
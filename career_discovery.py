@@ -13,46 +13,116 @@ Features:
 """
 
 import re
-from typing import List, Dict, Any, Optional, Set
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Set, Tuple
 from pathlib import Path
 
 from models import CareerData, Skill, Achievement, DiscoveredSkill
 from career_data_manager import load_career_data, save_career_data
 
 
+# Hallucination patterns, compiled once at import
+_PLACEHOLDER_RE = re.compile(
+    r'\[.*?\]'  # [relevant area], [specific metric]
+    r'|\{.*?\}'  # {details}, {example}
+    r'|\bTBD\b|\bTODO\b|\bFIXME\b'
+)
+_FUTURE_RE = re.compile(r'\b(?:will|going to|planning to|intending to|expect to)\b')
+_WORD_RE = re.compile(r'\w+')
+
+# Common technical skills and tools
+_TECH_KEYWORDS = frozenset({
+    # Programming languages
+    'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'go', 'rust',
+    'typescript', 'php', 'swift', 'kotlin', 'scala', 'r',
+
+    # Frameworks
+    'react', 'vue', 'angular', 'django', 'flask', 'spring', 'rails',
+    'express', 'fastapi', 'next.js', 'nuxt', 'svelte',
+
+    # Databases
+    'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
+    'dynamodb', 'cassandra', 'oracle', 'sqlite',
+
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform',
+    'jenkins', 'gitlab', 'github actions', 'circleci',
+
+    # Data & Analytics
+    'looker', 'tableau', 'power bi', 'pandas', 'numpy', 'spark',
+    'hadoop', 'airflow', 'kafka', 'snowflake',
+
+    # Product Management
+    'jira', 'confluence', 'asana', 'figma', 'miro', 'amplitude',
+    'mixpanel', 'google analytics', 'fullstory', 'a/b testing',
+
+    # Methodologies
+    'agile', 'scrum', 'kanban', 'lean', 'waterfall', 'safe',
+})
+
+# Display names that title() would get wrong
+_SPECIAL_CASES = {
+    'sql': 'SQL',
+    'aws': 'AWS',
+    'gcp': 'GCP',
+    'api': 'API',
+    'rest': 'REST',
+    'graphql': 'GraphQL',
+    'postgresql': 'PostgreSQL',
+    'mysql': 'MySQL',
+    'mongodb': 'MongoDB',
+    'javascript': 'JavaScript',
+    'typescript': 'TypeScript',
+    'next.js': 'Next.js',
+    'vue.js': 'Vue.js',
+    'react.js': 'React.js',
+    'node.js': 'Node.js',
+}
+
+# Display name for every keyword, so detection never re-capitalizes
+_KEYWORD_DISPLAY = {k: _SPECIAL_CASES.get(k, k.title()) for k in _TECH_KEYWORDS}
+
+# All keywords as one alternation so the text is scanned once.
+# Longest first, so 'github actions' wins over any shorter prefix.
+_TECH_KEYWORD_RE = re.compile(
+    r'\b(?:' +
+    '|'.join(re.escape(k) for k in sorted(_TECH_KEYWORDS, key=len, reverse=True)) +
+    r')\b'
+)
+
+# Vague quantifiers
+_VAGUE_QUANTIFIERS = frozenset({
+    'many', 'several', 'various', 'numerous', 'multiple',
+    'some', 'a lot', 'plenty', 'countless'
+})
+
+# Unverifiable claims
+_UNVERIFIABLE_CLAIMS = frozenset({
+    'best', 'world-class', 'leading', 'cutting-edge', 'state-of-the-art',
+    'revolutionary', 'groundbreaking', 'innovative', 'next-generation'
+})
+
+# Both term lists in one pattern, so the text is scanned once.
+# The lookahead reports overlapping hits, matching the plain
+# substring test ('some' in 'awesome' still counts).
+_TERM_CATEGORY = dict.fromkeys(_VAGUE_QUANTIFIERS, 'vague')
+_TERM_CATEGORY.update(dict.fromkeys(_UNVERIFIABLE_CLAIMS, 'unverifiable'))
+_TERM_RE = re.compile('(?=(' + '|'.join(re.escape(t) for t in _TERM_CATEGORY) + '))')
+
+
 class SkillDetector:
     """Detect missing skills from job descriptions."""
 
+    # Technology name formats, compiled once for all instances
+    tech_pattern = re.compile(
+        r'\b[A-Z][a-z]+\.[a-z]+\b'  # React.js, Vue.js, Next.js (must have .js/.py)
+        r'|\b[A-Z]{3,}\b'  # AWS, GCP, SQL (3+ letters, filters out PM, US, OR, etc.)
+    )
+
     def __init__(self):
-        # Common technical skills and tools
-        self.tech_keywords = {
-            # Programming languages
-            'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'go', 'rust',
-            'typescript', 'php', 'swift', 'kotlin', 'scala', 'r',
-
-            # Frameworks
-            'react', 'vue', 'angular', 'django', 'flask', 'spring', 'rails',
-            'express', 'fastapi', 'next.js', 'nuxt', 'svelte',
-
-            # Databases
-            'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
-            'dynamodb', 'cassandra', 'oracle', 'sqlite',
-
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform',
-            'jenkins', 'gitlab', 'github actions', 'circleci',
-
-            # Data & Analytics
-            'looker', 'tableau', 'power bi', 'pandas', 'numpy', 'spark',
-            'hadoop', 'airflow', 'kafka', 'snowflake',
-
-            # Product Management
-            'jira', 'confluence', 'asana', 'figma', 'miro', 'amplitude',
-            'mixpanel', 'google analytics', 'fullstory', 'a/b testing',
-
-            # Methodologies
-            'agile', 'scrum', 'kanban', 'lean', 'waterfall', 'safe',
-        }
+        self.tech_keywords = _TECH_KEYWORDS
 
     def detect_missing_skills(
         self,
@@ -72,79 +142,66 @@ class SkillDetector:
             List of detected skill names
         """
         # Get existing skills, skipped skills, and ignored terms (lowercase for comparison)
-        existing_skills = {skill.name.lower() for skill in career_data.skills}
-        skipped_skills = {skill.lower() for skill in career_data.skipped_skills}
-        ignored_terms = {term.lower() for term in career_data.ignored_terms}
+        # (one set, so each candidate needs a single membership test)
+        excluded = {skill.name.lower() for skill in career_data.skills}
+        excluded.update(skill.lower() for skill in career_data.skipped_skills)
+        excluded.update(term.lower() for term in career_data.ignored_terms)
 
         # Detect skills in job description
-        detected = set()
+        # (display name -> lowercase key into the occurrence counts)
+        detected: Dict[str, str] = {}
         job_lower = job_description.lower()
 
-        # Method 1: Keyword matching (word boundary only)
-        for keyword in self.tech_keywords:
-            # Use word boundaries to avoid false matches (e.g., 'r' in 'for')
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if (re.search(pattern, job_lower, re.IGNORECASE) and
-                keyword not in existing_skills and
-                keyword not in skipped_skills and
-                keyword not in ignored_terms):
-                # Capitalize properly
-                detected.add(self._capitalize_skill(keyword))
+        # Method 1: Keyword matching (word boundary only, single pass)
+        # Word boundaries avoid false matches (e.g., 'r' in 'for')
+        counts = Counter(m.group() for m in _TECH_KEYWORD_RE.finditer(job_lower))
+        for keyword in counts:
+            if keyword not in excluded:
+                detected[_KEYWORD_DISPLAY[keyword]] = keyword
 
         # Method 2: Technology detection (regex patterns - only known tech formats)
         # Only match .js/.py frameworks and 3+ letter acronyms commonly used in tech
-        tech_patterns = [
-            r'\b([A-Z][a-z]+\.[a-z]+)\b',  # React.js, Vue.js, Next.js (must have .js/.py)
-            r'\b([A-Z]{3,})\b',  # AWS, GCP, SQL (3+ letters, filters out PM, US, OR, etc.)
-        ]
-
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, job_description)
-            for match in matches:
-                # Additional filtering: must be in common tech acronyms or frameworks
-                if (match.lower() not in existing_skills and
-                    match.lower() not in skipped_skills and
-                    match.lower() not in ignored_terms and
-                    (match.endswith(('.js', '.py')) or  # Framework with extension
-                     match.lower() in self.tech_keywords or  # Known tech keyword
-                     len(match) >= 4)):  # Longer acronyms are safer (REST, JSON, HTTP)
-                    detected.add(match)
+        for m in self.tech_pattern.finditer(job_description):
+            match = m.group()
+            match_lower = match.lower()
+            # Known keywords were already counted by the keyword pass
+            if match_lower not in self.tech_keywords:
+                counts[match_lower] += 1
+            # Additional filtering: must be in common tech acronyms or frameworks
+            if (match_lower not in excluded and
+                (match.endswith(('.js', '.py')) or  # Framework with extension
+                 match_lower in self.tech_keywords or  # Known tech keyword
+                 len(match) >= 4)):  # Longer acronyms are safer (REST, JSON, HTTP)
+                detected.setdefault(match, match_lower)
 
         # Convert to sorted list (by frequency in job description)
-        detected_list = list(detected)
-        detected_list.sort(
-            key=lambda s: job_lower.count(s.lower()),
+        detected_list = sorted(
+            detected,
+            key=lambda s: counts[detected[s]],
             reverse=True
         )
 
         return detected_list[:max_skills]
 
-    def _capitalize_skill(self, skill: str) -> str:
-        """Capitalize skill name properly."""
-        # Special cases
-        special_cases = {
-            'sql': 'SQL',
-            'aws': 'AWS',
-            'gcp': 'GCP',
-            'api': 'API',
-            'rest': 'REST',
-            'graphql': 'GraphQL',
-            'postgresql': 'PostgreSQL',
-            'mysql': 'MySQL',
-            'mongodb': 'MongoDB',
-            'javascript': 'JavaScript',
-            'typescript': 'TypeScript',
-            'next.js': 'Next.js',
-            'vue.js': 'Vue.js',
-            'react.js': 'React.js',
-            'node.js': 'Node.js',
-        }
 
-        if skill.lower() in special_cases:
-            return special_cases[skill.lower()]
+@dataclass(frozen=True)
+class _Timeframe:
+    """A discovered skill's timeframe, parsed once per validation."""
+    start: str
+    end: str
+    start_date: datetime
+
+
+def _parse_timeframe(timeframe: str) -> _Timeframe:
+    """Split 'YYYY-MM' or 'YYYY-MM to YYYY-MM|Present' into a _Timeframe."""
+    if ' to ' in timeframe:
+        start, end = timeframe.split(' to ')
+    else:
+        start = timeframe
+        end = start
 
-        # Default: title case
-        return skill.title()
+    year, month = map(int, start.split('-'))
+    return _Timeframe(start, end, datetime(year, month, 1))
 
 
 class ConsistencyValidator:
@@ -153,6 +210,16 @@ class ConsistencyValidator:
     def __init__(self, career_data: CareerData):
         self.career_data = career_data
 
+        # Jobs keyed by lowercase company name (first job wins, as in job order)
+        self._jobs_by_company: Dict[str, Any] = {}
+        for job in career_data.jobs:
+            self._jobs_by_company.setdefault(job.company.lower(), job)
+
+        # Skills keyed by lowercase name (first skill wins, as in skill order)
+        self._skills_by_name: Dict[str, Any] = {}
+        for skill in career_data.skills:
+            self._skills_by_name.setdefault(skill.name.lower(), skill)
+
     def validate(self, discovered: DiscoveredSkill) -> Dict[str, Any]:
         """
         Validate discovered skill for consistency.
@@ -164,11 +231,34 @@ class ConsistencyValidator:
             'errors': List[str]
         }
         """
+        return self._validate(discovered, datetime.now())
+
+    def validate_many(self, discovered_skills: List[DiscoveredSkill]) -> List[Dict[str, Any]]:
+        """
+        Validate several discovered skills in one batch.
+
+        The job and skill indexes are shared and the clock is read once, so
+        every skill in the batch is checked against the same "now".
+
+        Args:
+            discovered_skills: DiscoveredSkill instances to validate
+
+        Returns:
+            One validation result dict per skill, in input order
+        """
+        now = datetime.now()
+        return [self._validate(discovered, now) for discovered in discovered_skills]
+
+    def _validate(self, discovered: DiscoveredSkill, now: datetime) -> Dict[str, Any]:
+        """Run all checks for one discovered skill against a fixed current time."""
         warnings = []
         errors = []
 
+        # Parse the timeframe once for all date checks
+        timeframe = _parse_timeframe(discovered.timeframe)
+
         # Check 1: Timeframe within job history
-        timeframe_valid = self._validate_timeframe(discovered, warnings, errors)
+        timeframe_valid = self._validate_timeframe(discovered, timeframe, warnings, errors)
 
         # Check 2: Company exists in job history
         company_valid = self._validate_company(discovered, warnings)
@@ -177,10 +267,10 @@ class ConsistencyValidator:
         self._check_duplicate(discovered, warnings)
 
         # Check 4: No future dates
-        self._check_future_dates(discovered, errors)
+        self._check_future_dates(timeframe, now, errors)
 
         # Check 5: Reasonability (<10 years ago for new skills)
-        self._check_reasonability(discovered, warnings)
+        self._check_reasonability(timeframe, now, warnings)
 
         return {
             'valid': len(errors) == 0,
@@ -191,28 +281,19 @@ class ConsistencyValidator:
     def _validate_timeframe(
         self,
         discovered: DiscoveredSkill,
+        timeframe: _Timeframe,
         warnings: List[str],
         errors: List[str]
     ) -> bool:
         """Validate timeframe is within job history."""
-        # Parse timeframe
-        if ' to ' in discovered.timeframe:
-            start, end = discovered.timeframe.split(' to ')
-        else:
-            start = discovered.timeframe
-            end = start
-
+        start, end = timeframe.start, timeframe.end
         # Find matching job
-        company_match = None
-        for job in self.career_data.jobs:
-            if job.company.lower() == discovered.company.lower():
-                company_match = job
-                break
+        company_match = self._jobs_by_company.get(discovered.company.lower())
 
         if company_match:
             # Check if timeframe overlaps with job dates
-            job_start = job.start_date
-            job_end = job.end_date if job.end_date != 'Present' else '2099-12'
+            job_start = company_match.start_date
+            job_end = company_match.end_date if company_match.end_date != 'Present' else '2099-12'
 
             if start < job_start or (end != 'Present' and end > job_end):
                 warnings.append(
@@ -226,9 +307,7 @@ class ConsistencyValidator:
 
     def _validate_company(self, discovered: DiscoveredSkill, warnings: List[str]) -> bool:
         """Validate company exists in job history."""
-        companies = {job.company.lower() for job in self.career_data.jobs}
-
-        if discovered.company.lower() not in companies:
+        if discovered.company.lower() not in self._jobs_by_company:
             warnings.append(
                 f"Company '{discovered.company}' is not in your job history. "
                 f"Is this a side project or freelance work?"
@@ -239,25 +318,17 @@ class ConsistencyValidator:
 
     def _check_duplicate(self, discovered: DiscoveredSkill, warnings: List[str]):
         """Check if skill already exists."""
-        for skill in self.career_data.skills:
-            if skill.name.lower() == discovered.name.lower():
-                warnings.append(
-                    f"You already have '{skill.name}' listed with "
-                    f"{len(skill.examples)} example(s). Add this as another example?"
-                )
-                break
+        skill = self._skills_by_name.get(discovered.name.lower())
+        if skill:
+            warnings.append(
+                f"You already have '{skill.name}' listed with "
+                f"{len(skill.examples)} example(s). Add this as another example?"
+            )
 
-    def _check_future_dates(self, discovered: DiscoveredSkill, errors: List[str]):
+    def _check_future_dates(self, timeframe: _Timeframe, now: datetime, errors: List[str]):
         """Check for future dates."""
-        from datetime import datetime
-
-        if ' to ' in discovered.timeframe:
-            start, end = discovered.timeframe.split(' to ')
-        else:
-            start = discovered.timeframe
-            end = start
-
-        current_month = datetime.now().strftime('%Y-%m')
+        start, end = timeframe.start, timeframe.end
+        current_month = now.strftime('%Y-%m')
 
         if start > current_month:
             errors.append(f"Start date ({start}) is in the future!")
@@ -265,21 +336,9 @@ class ConsistencyValidator:
         if end != 'Present' and end > current_month:
             errors.append(f"End date ({end}) is in the future!")
 
-    def _check_reasonability(self, discovered: DiscoveredSkill, warnings: List[str]):
+    def _check_reasonability(self, timeframe: _Timeframe, now: datetime, warnings: List[str]):
         """Check if timeframe is reasonable (<10 years old for new skills)."""
-        from datetime import datetime
-
-        if ' to ' in discovered.timeframe:
-            start, _ = discovered.timeframe.split(' to ')
-        else:
-            start = discovered.timeframe
-
-        # Parse year and month
-        year, month = map(int, start.split('-'))
-        skill_date = datetime(year, month, 1)
-        current_date = datetime.now()
-
-        years_ago = (current_date - skill_date).days / 365.25
+        years_ago = (now - timeframe.start_date).days / 365.25
 
         if years_ago > 10:
             warnings.append(
@@ -292,24 +351,14 @@ class HallucinationDetector:
     """Detect hallucination patterns in user responses."""
 
     def __init__(self):
-        # Vague quantifiers
-        self.vague_quantifiers = {
-            'many', 'several', 'various', 'numerous', 'multiple',
-            'some', 'a lot', 'plenty', 'countless'
-        }
-
-        # Unverifiable claims
-        self.unverifiable_claims = {
-            'best', 'world-class', 'leading', 'cutting-edge', 'state-of-the-art',
-            'revolutionary', 'groundbreaking', 'innovative', 'next-generation'
-        }
+        self.vague_quantifiers = _VAGUE_QUANTIFIERS
+        self.unverifiable_claims = _UNVERIFIABLE_CLAIMS
 
-        # Placeholder patterns
-        self.placeholder_patterns = [
-            r'\[.*?\]',  # [relevant area], [specific metric]
-            r'\{.*?\}',  # {details}, {example}
-            r'\bTBD\b', r'\bTODO\b', r'\bFIXME\b'
-        ]
+        # (job description, word set) for the last description seen; the same
+        # description is usually checked against many candidate texts. Kept
+        # as one tuple so a shared detector never pairs a text with the
+        # wrong word set.
+        self._job_words: Tuple[Optional[str], Set[str]] = (None, set())
 
     def detect(self, text: str, job_description: str = "") -> List[str]:
         """
@@ -320,8 +369,17 @@ class HallucinationDetector:
         warnings = []
         text_lower = text.lower()
 
+        # Find vague quantifiers and unverifiable claims in one pass
+        found_vague = {}
+        found_unverifiable = {}
+        for match in _TERM_RE.finditer(text_lower):
+            term = match.group(1)
+            if _TERM_CATEGORY[term] == 'vague':
+                found_vague[term] = None
+            else:
+                found_unverifiable[term] = None
+
         # Check vague quantifiers
-        found_vague = [q for q in self.vague_quantifiers if q in text_lower]
         if found_vague:
             warnings.append(
                 f"Vague quantifiers detected: {', '.join(found_vague)}. "
@@ -329,7 +387,6 @@ class HallucinationDetector:
             )
 
         # Check unverifiable claims
-        found_unverifiable = [c for c in self.unverifiable_claims if c in text_lower]
         if found_unverifiable:
             warnings.append(
                 f"Unverifiable claims detected: {', '.join(found_unverifiable)}. "
@@ -337,17 +394,15 @@ class HallucinationDetector:
             )
 
         # Check placeholder patterns
-        for pattern in self.placeholder_patterns:
-            if re.search(pattern, text):
-                warnings.append(
-                    f"Placeholder text detected. Complete the example with "
-                    f"specific details."
-                )
-                break
+        if _PLACEHOLDER_RE.search(text):
+            warnings.append(
+                f"Placeholder text detected. Complete the example with "
+                f"specific details."
+            )
 
         # Check similarity to job description (copy-paste detection)
         if job_description:
-            similarity = self._calculate_similarity(text, job_description)
+            similarity = self._calculate_similarity(text_lower, job_description)
             if similarity > 0.7:
                 warnings.append(
                     f"High similarity ({similarity*100:.0f}%) to job description. "
@@ -355,32 +410,58 @@ class HallucinationDetector:
                 )
 
         # Check for future tense (suggests not completed)
-        future_patterns = [
-            r'\bwill\b', r'\bgoing to\b', r'\bplanning to\b',
-            r'\bintending to\b', r'\bexpect to\b'
-        ]
-        for pattern in future_patterns:
-            if re.search(pattern, text_lower):
-                warnings.append(
-                    "Future tense detected. Describe what you've already done, "
-                    "not what you plan to do."
-                )
-                break
+        if _FUTURE_RE.search(text_lower):
+            warnings.append(
+                "Future tense detected. Describe what you've already done, "
+                "not what you plan to do."
+            )
 
         return warnings
 
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Simple word overlap similarity (0-1)."""
-        words1 = set(re.findall(r'\w+', text1.lower()))
-        words2 = set(re.findall(r'\w+', text2.lower()))
+    def _calculate_similarity(self, text1_lower: str, text2: str) -> float:
+        """Simple word overlap similarity (0-1). text1 must already be lowercase."""
+        words1 = set(_WORD_RE.findall(text1_lower))
+        words2 = self._words_of_job_description(text2)
 
         if not words1 or not words2:
             return 0.0
 
+        # Jaccard index without building the union set
         overlap = len(words1 & words2)
-        total = len(words1 | words2)
+        return overlap / (len(words1) + len(words2) - overlap)
+
+    def _words_of_job_description(self, job_description: str) -> Set[str]:
+        """Lowercase word set of a job description, reused across calls."""
+        source, words = self._job_words
+        if job_description != source:
+            words = set(_WORD_RE.findall(job_description.lower()))
+            self._job_words = (job_description, words)
+        return words
+
+
+# Shared detector instances (initialized lazily); both are safe to reuse
+_skill_detector: Optional[SkillDetector] = None
+_hallucination_detector: Optional[HallucinationDetector] = None
+
+
+def get_skill_detector() -> SkillDetector:
+    """Get or create the shared SkillDetector."""
+    global _skill_detector
+
+    if _skill_detector is None:
+        _skill_detector = SkillDetector()
+
+    return _skill_detector
+
+
+def get_hallucination_detector() -> HallucinationDetector:
+    """Get or create the shared HallucinationDetector."""
+    global _hallucination_detector
+
+    if _hallucination_detector is None:
+        _hallucination_detector = HallucinationDetector()
 
-        return overlap / total if total > 0 else 0.0
+    return _hallucination_detector
 
 
 # Convenience functions
@@ -396,8 +477,7 @@ def detect_missing_skills(job_description: str, max_skills: int = 5) -> List[str
         List of skill names
     """
     career_data = load_career_data()
-    detector = SkillDetector()
-    return detector.detect_missing_skills(job_description, career_data, max_skills)
+    return get_skill_detector().detect_missing_skills(job_description, career_data, max_skills)
 
 
 def validate_discovered_skill(discovered: DiscoveredSkill) -> Dict[str, Any]:
@@ -426,8 +506,7 @@ def detect_hallucinations(text: str, job_description: str = "") -> List[str]:
     Returns:
         List of warning messages
     """
-    detector = HallucinationDetector()
-    return detector.detect(text, job_description)
+    return get_hallucination_detector().detect(text, job_description)
 
 
 def get_skill_context(skill_name: str, job_description: str, words_before: int = 5, words_after: int = 5) -> str:
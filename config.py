@@ -4,6 +4,7 @@ Centralized configuration for Resume Tailor.
 Single source of truth for contact info, API settings, and output preferences.
 """
 
+from importlib.util import find_spec
 from pathlib import Path
 import os
 
@@ -111,6 +112,9 @@ def check_optional_dependency(module_name: str) -> bool:
     """
     Check if an optional dependency is available.
 
+    Looks the module up without importing it, so heavy packages such as
+    reportlab are not initialized just to answer the question.
+
     Args:
         module_name: Name of the module to check (e.g., 'reportlab', 'docx')
 
@@ -118,15 +122,24 @@ def check_optional_dependency(module_name: str) -> bool:
         bool: True if module is available, False otherwise
     """
     try:
-        __import__(module_name)
-        return True
-    except ImportError:
+        return find_spec(module_name) is not None
+    except (ImportError, ValueError):
         return False
 
-# Check availability of optional format generators
-PDF_AVAILABLE = check_optional_dependency('reportlab')
-DOCX_AVAILABLE = check_optional_dependency('docx')
-HTML_AVAILABLE = check_optional_dependency('markdown')
+# Availability of optional format generators, checked on first access
+_OPTIONAL_DEPENDENCY_FLAGS = {
+    'PDF_AVAILABLE': 'reportlab',
+    'DOCX_AVAILABLE': 'docx',
+    'HTML_AVAILABLE': 'markdown',
+}
+
+def __getattr__(name: str):
+    """Resolve PDF_AVAILABLE / DOCX_AVAILABLE / HTML_AVAILABLE lazily (PEP 562)."""
+    if name in _OPTIONAL_DEPENDENCY_FLAGS:
+        available = check_optional_dependency(_OPTIONAL_DEPENDENCY_FLAGS[name])
+        globals()[name] = available
+        return available
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ==========================================
 # Career Data Storage (Local JSON)
@@ -5,11 +5,24 @@ Detects when new career information contradicts existing data in supermemory.
 Prompts user to resolve conflicts before allowing updates.
 """
 
-from typing import Dict, List, Any, Tuple
+from collections import defaultdict
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 import re
 
 
+_DATE_RANGE_RE = re.compile(r'([^-–—]*)[-–—]([^-–—]*)')
+_PCT_RE = re.compile(r'(\d+)%')
+_METRIC_KEYWORD_RE = re.compile(r'engagement|completion|usage|revenue|reduction|increase')
+_MONTH_YEAR_RE = re.compile(r'(?:(\d{1,2})/)?(\d{4})')  # "01/2024" or "2024"
+
+# A parsed date as (year, month); month is None for a bare year
+_YearMonth = Tuple[int, Optional[int]]
+
+# (year, month) used for "present" so open-ended jobs overlap anything later
+_OPEN_ENDED = (9999, 12)
+
+
 class DataConflict:
     """Represents a detected conflict between new and existing data."""
 
@@ -46,9 +59,28 @@ class ConflictDetector:
         self.existing_data = existing_data
         self.conflicts: List[DataConflict] = []
 
+        # Existing jobs and achievements grouped by company, built once
+        self._jobs_by_company: Dict[str, List[Dict]] = defaultdict(list)
+        for job in existing_data.get("job_history", []):
+            self._jobs_by_company[job.get("company")].append(job)
+
+        self._achievements_by_company: Dict[str, List[Dict]] = defaultdict(list)
+        for achievement in existing_data.get("achievements", []):
+            self._achievements_by_company[achievement.get("company")].append(achievement)
+
+        # Existing job date ranges as (job, start, end), parsed once
+        self._job_intervals: List[Tuple[Dict, _YearMonth, _YearMonth]] = []
+        for job in existing_data.get("job_history", []):
+            interval = self._parse_interval(job.get("dates", ""))
+            if interval:
+                self._job_intervals.append((job, *interval))
+
     def check_contact_info(self, new_contact: Dict[str, str]) -> List[DataConflict]:
         """Check for conflicts in contact information."""
-        conflicts = []
+        return list(self._iter_contact_conflicts(new_contact))
+
+    def _iter_contact_conflicts(self, new_contact: Dict[str, str]) -> Iterator[DataConflict]:
+        """Yield contact information conflicts."""
         existing_contact = self.existing_data.get("contact_info", {})
 
         for field in ["email", "phone", "linkedin", "name"]:
@@ -57,67 +89,63 @@ class ConflictDetector:
                 existing_val = existing_contact.get(field, "").strip()
 
                 if existing_val and new_val and new_val != existing_val:
-                    conflicts.append(DataConflict(
+                    yield DataConflict(
                         conflict_type="Contact Info Changed",
                         field=field,
                         existing_value=existing_val,
                         new_value=new_val,
                         severity="high",  # Contact info changes are critical
                         context="Contact information should rarely change"
-                    ))
-
-        return conflicts
+                    )
 
     def check_job_dates(self, new_job: Dict[str, Any]) -> List[DataConflict]:
         """Check for date conflicts in job history."""
-        conflicts = []
+        return list(self._iter_job_conflicts(new_job))
+
+    def _iter_job_conflicts(self, new_job: Dict[str, Any]) -> Iterator[DataConflict]:
+        """Yield job date conflicts."""
         company = new_job.get("company", "")
         new_dates = new_job.get("dates", "")
 
         # Find existing job at same company
-        for existing_job in self.existing_data.get("job_history", []):
-            if existing_job.get("company") == company:
-                existing_dates = existing_job.get("dates", "")
-
-                if existing_dates and new_dates and existing_dates != new_dates:
-                    conflicts.append(DataConflict(
-                        conflict_type="Job Dates Changed",
-                        field=f"{company} employment dates",
-                        existing_value=existing_dates,
-                        new_value=new_dates,
-                        severity="high",
-                        context=f"Dates for {company} don't match"
-                    ))
-
-                # Check for date overlaps with other jobs
-                date_conflict = self._check_date_overlap(new_job, self.existing_data.get("job_history", []))
-                if date_conflict:
-                    conflicts.append(date_conflict)
+        for existing_job in self._jobs_by_company.get(company, ()):
+            existing_dates = existing_job.get("dates", "")
+
+            if existing_dates and new_dates and existing_dates != new_dates:
+                yield DataConflict(
+                    conflict_type="Job Dates Changed",
+                    field=f"{company} employment dates",
+                    existing_value=existing_dates,
+                    new_value=new_dates,
+                    severity="high",
+                    context=f"Dates for {company} don't match"
+                )
 
-        return conflicts
+            # Check for date overlaps with other jobs
+            date_conflict = self._check_date_overlap(new_job)
+            if date_conflict:
+                yield date_conflict
 
-    def _check_date_overlap(self, new_job: Dict[str, Any], existing_jobs: List[Dict]) -> DataConflict | None:
+    def _check_date_overlap(self, new_job: Dict[str, Any]) -> DataConflict | None:
         """Check if new job dates overlap with existing jobs (indicating impossible timeline)."""
         new_dates = new_job.get("dates", "")
         new_company = new_job.get("company", "")
 
         # Parse date range (simple parser for common formats like "01/2024 - 03/2025")
-        new_start, new_end = self._parse_date_range(new_dates)
-        if not new_start:
+        new_interval = self._parse_interval(new_dates)
+        if not new_interval:
             return None
+        new_start, new_end = new_interval
 
-        for job in existing_jobs:
+        for job, existing_start, existing_end in self._job_intervals:
             if job.get("company") == new_company:
                 continue  # Skip same company
 
-            existing_dates = job.get("dates", "")
-            existing_start, existing_end = self._parse_date_range(existing_dates)
-
-            if existing_start and self._dates_overlap(new_start, new_end, existing_start, existing_end):
+            if self._dates_overlap(new_start, new_end, existing_start, existing_end):
                 return DataConflict(
                     conflict_type="Date Overlap",
                     field="employment timeline",
-                    existing_value=f"{job.get('company')}: {existing_dates}",
+                    existing_value=f"{job.get('company')}: {job.get('dates', '')}",
                     new_value=f"{new_company}: {new_dates}",
                     severity="high",
                     context="Cannot work at two places simultaneously"
@@ -131,67 +159,101 @@ class ConflictDetector:
             return None, None
 
         # Handle formats like "01/2024 - 03/2025" or "2024-2025"
-        parts = re.split(r'[-–—]', date_str)
-        if len(parts) == 2:
-            start = parts[0].strip()
-            end = parts[1].strip() if parts[1].strip().lower() not in ["present", "current"] else "present"
+        match = _DATE_RANGE_RE.fullmatch(date_str)
+        if match:
+            start = match.group(1).strip()
+            end = match.group(2).strip()
+            if end.lower() in ("present", "current"):
+                end = "present"
             return start, end
 
         return None, None
 
-    def _dates_overlap(self, start1: str, end1: str, start2: str, end2: str) -> bool:
-        """Check if two date ranges overlap."""
-        # Simplified overlap detection - could be enhanced with actual date parsing
-        # For now, just check for obvious overlaps
-        if end1 == "present" or end2 == "present":
-            return True  # Current jobs might overlap with contract/consulting work
+    def _parse_interval(self, date_str: str) -> Tuple[_YearMonth, _YearMonth] | None:
+        """
+        Parse a date range into (start, end) points of (year, month).
 
-        return False  # More sophisticated logic would go here
+        The month is None when only a year is given. "Present" maps to an
+        open-ended point. Returns None if either side can't be parsed.
+        """
+        start, end = self._parse_date_range(date_str)
+        if not start:
+            return None
+
+        start_point = self._parse_year_month(start)
+        end_point = _OPEN_ENDED if end == "present" else self._parse_year_month(end)
+
+        if start_point is None or end_point is None:
+            return None
+        return start_point, end_point
+
+    def _parse_year_month(self, value: str) -> _YearMonth | None:
+        """Parse "MM/YYYY" or "YYYY" into (year, month or None)."""
+        match = _MONTH_YEAR_RE.fullmatch(value)
+        if not match:
+            return None
+
+        month = match.group(1)
+        return int(match.group(2)), int(month) if month else None
+
+    def _before(self, a: _YearMonth, b: _YearMonth) -> bool:
+        """Check if a is strictly earlier than b, by year alone if either lacks a month."""
+        if a[1] is None or b[1] is None:
+            return a[0] < b[0]
+        return a < b
+
+    def _dates_overlap(self, start1: _YearMonth, end1: _YearMonth,
+                       start2: _YearMonth, end2: _YearMonth) -> bool:
+        """
+        Check if two date ranges overlap.
+
+        Sharing only a boundary (one job ends the month - or, for bare years,
+        the year - the next one starts) is a normal handover, not an overlap.
+        """
+        return self._before(start1, end2) and self._before(start2, end1)
 
     def check_achievement_metrics(self, new_achievement: Dict[str, Any]) -> List[DataConflict]:
         """Check for conflicts in achievement metrics."""
-        conflicts = []
+        return list(self._iter_achievement_conflicts(new_achievement))
+
+    def _iter_achievement_conflicts(self, new_achievement: Dict[str, Any]) -> Iterator[DataConflict]:
+        """Yield achievement metric conflicts."""
         company = new_achievement.get("company", "")
         new_metric = new_achievement.get("metrics", "")
 
         # Find similar achievements at same company
-        for existing_achievement in self.existing_data.get("achievements", []):
-            if existing_achievement.get("company") == company:
-                existing_metric = existing_achievement.get("metrics", "")
-
-                # Check if both mention the same type of metric (e.g., both mention "engagement")
-                if self._similar_metrics(new_metric, existing_metric):
-                    # Extract percentages
-                    new_pct = self._extract_percentage(new_metric)
-                    existing_pct = self._extract_percentage(existing_metric)
-
-                    if new_pct and existing_pct and new_pct != existing_pct:
-                        conflicts.append(DataConflict(
-                            conflict_type="Metric Mismatch",
-                            field=f"{company} achievement metric",
-                            existing_value=existing_metric,
-                            new_value=new_metric,
-                            severity="high",
-                            context="Same achievement reported with different numbers"
-                        ))
-
-        return conflicts
+        for existing_achievement in self._achievements_by_company.get(company, ()):
+            existing_metric = existing_achievement.get("metrics", "")
+
+            # Check if both mention the same type of metric (e.g., both mention "engagement")
+            if self._similar_metrics(new_metric, existing_metric):
+                # Extract percentages
+                new_pct = self._extract_percentage(new_metric)
+                existing_pct = self._extract_percentage(existing_metric)
+
+                if new_pct and existing_pct and new_pct != existing_pct:
+                    yield DataConflict(
+                        conflict_type="Metric Mismatch",
+                        field=f"{company} achievement metric",
+                        existing_value=existing_metric,
+                        new_value=new_metric,
+                        severity="high",
+                        context="Same achievement reported with different numbers"
+                    )
 
     def _similar_metrics(self, metric1: str, metric2: str) -> bool:
         """Check if two metrics are talking about the same thing."""
-        keywords = ["engagement", "completion", "usage", "revenue", "reduction", "increase"]
-        metric1_lower = metric1.lower()
-        metric2_lower = metric2.lower()
-
-        for keyword in keywords:
-            if keyword in metric1_lower and keyword in metric2_lower:
-                return True
+        # Keywords match as substrings, so "increased" counts as "increase"
+        keywords = set(_METRIC_KEYWORD_RE.findall(metric1.lower()))
+        if not keywords:
+            return False
 
-        return False
+        metric2_lower = metric2.lower()
+        return any(keyword in metric2_lower for keyword in keywords)
 
     def _extract_percentage(self, text: str) -> str | None:
         """Extract percentage from text (e.g., "32%" from "32% increase")."""
-        match = re.search(r'(\d+)%', text)
+        match = _PCT_RE.search(text)
         return match.group(1) if match else None
 
     def check_all(self, new_data: Dict[str, Any]) -> List[DataConflict]:
@@ -204,23 +266,23 @@ class ConflictDetector:
         Returns:
             List of detected conflicts
         """
-        all_conflicts = []
+        return list(self._iter_all_conflicts(new_data))
 
+    def _iter_all_conflicts(self, new_data: Dict[str, Any]) -> Iterator[DataConflict]:
+        """Yield conflicts from every section of new_data."""
         # Check contact info
         if "contact_info" in new_data:
-            all_conflicts.extend(self.check_contact_info(new_data["contact_info"]))
+            yield from self._iter_contact_conflicts(new_data["contact_info"])
 
         # Check job history
         if "job_history" in new_data:
             for job in new_data["job_history"]:
-                all_conflicts.extend(self.check_job_dates(job))
+                yield from self._iter_job_conflicts(job)
 
         # Check achievements
         if "achievements" in new_data:
             for achievement in new_data["achievements"]:
-                all_conflicts.extend(self.check_achievement_metrics(achievement))
-
-        return all_conflicts
+                yield from self._iter_achievement_conflicts(achievement)
 
     def generate_conflict_report(self, conflicts: List[DataConflict]) -> str:
         """Generate a human-readable conflict report."""
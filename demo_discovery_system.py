@@ -5,30 +5,56 @@ Demonstrates the full discovery workflow with realistic examples.
 """
 
 import os
+import sys
 import tempfile
-import shutil
-from pathlib import Path
-
-# Override config for demo
-demo_dir = Path(tempfile.mkdtemp())
-demo_career_file = demo_dir / "career_data.json"
-os.environ['CAREER_DATA_FILE'] = str(demo_career_file)
 
 from career_discovery import (
     SkillDetector,
     ConsistencyValidator,
-    HallucinationDetector,
-    detect_missing_skills
+    detect_missing_skills,
+    get_hallucination_detector
 )
 from models import CareerData, ContactInfo, Job, Skill, Achievement, DiscoveredSkill
-from career_data_manager import save_career_data, load_career_data
+from career_data_manager import get_manager, save_career_data, load_career_data
+
+
+# Fixed output, built once at import
+_RULE = "=" * 70
+_HEADER_TEMPLATE = f"\n{_RULE}\n  {{}}\n{_RULE}"
+
+_ENRICHMENT_TIMELINE = """
+[Job Application 1] Platform Engineering Role
+  Added skills: Kubernetes (1 example)
+  Total skills: 2
+
+[Job Application 2] Data Engineering Role
+  Detected: PostgreSQL, Python, AWS
+  Added: PostgreSQL (1 example), Python (1 example)
+  Total skills: 4
+
+[Job Application 3] Senior PM Role
+  Detected: Product Management, Jira, A/B Testing
+  Product Management already exists - add another example!
+  Added: Jira (1 example), A/B Testing (1 example)
+  Updated: Product Management (2 examples now)
+  Total skills: 6
+
+[After 3 Applications]
+  Skills grown from 1 to 6
+  Product Management has 2 concrete examples
+  Each skill has context: company, timeframe, measurable result
+  Future applications can auto-populate these skills!
+
+[Benefits]
+  - Richer career data over time
+  - More specific examples for resumes
+  - No hallucinations (all user-provided)
+  - Natural workflow integration"""
 
 
 def print_header(title):
     """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+    print(_HEADER_TEMPLATE.format(title))
 
 
 def demo_skill_detection():
@@ -163,7 +189,7 @@ def demo_validation_good_example():
 
     # Hallucination detection
     print("\n[Hallucination Check] Scanning for problematic patterns...")
-    detector = HallucinationDetector()
+    detector = get_hallucination_detector()
     hallucinations = detector.detect(discovered.example)
 
     if not hallucinations:
@@ -214,7 +240,7 @@ def demo_validation_bad_example():
         print(f"  Warnings: {validation['warnings']}")
 
         # Hallucination detection
-        detector = HallucinationDetector()
+        detector = get_hallucination_detector()
         hallucinations = detector.detect(discovered.example)
 
         print(f"\n[Hallucination Detection]")
@@ -247,53 +273,33 @@ def demo_data_enrichment():
     for skill in career_data.skills:
         print(f"    - {skill.name} ({len(skill.examples)} examples)")
 
-    print("\n[Job Application 1] Platform Engineering Role")
-    print("  Added skills: Kubernetes (1 example)")
-    print("  Total skills: 2")
+    print(_ENRICHMENT_TIMELINE)
 
-    print("\n[Job Application 2] Data Engineering Role")
-    print("  Detected: PostgreSQL, Python, AWS")
-    print("  Added: PostgreSQL (1 example), Python (1 example)")
-    print("  Total skills: 4")
 
-    print("\n[Job Application 3] Senior PM Role")
-    print("  Detected: Product Management, Jira, A/B Testing")
-    print("  Product Management already exists - add another example!")
-    print("  Added: Jira (1 example), A/B Testing (1 example)")
-    print("  Updated: Product Management (2 examples now)")
-    print("  Total skills: 6")
+def main():
+    """Run all demos."""
+    print(_HEADER_TEMPLATE.format("RESUME TAILOR - INTERACTIVE DISCOVERY SYSTEM\n  Live Demo"))
 
-    print("\n[After 3 Applications]")
-    print("  Skills grown from 1 to 6")
-    print("  Product Management has 2 concrete examples")
-    print("  Each skill has context: company, timeframe, measurable result")
-    print("  Future applications can auto-populate these skills!")
+    # Demo data lives in a temporary directory that is removed on exit
+    with tempfile.TemporaryDirectory() as demo_dir:
+        demo_career_file = os.path.join(demo_dir, "career_data.json")
 
-    print("\n[Benefits]")
-    print("  - Richer career data over time")
-    print("  - More specific examples for resumes")
-    print("  - No hallucinations (all user-provided)")
-    print("  - Natural workflow integration")
+        # Point the shared manager at the demo file before anything loads.
+        # The data is throwaway, so skip fsync on save.
+        os.environ['CAREER_DATA_FILE'] = demo_career_file
+        manager = get_manager()
+        manager.file_path = demo_career_file
+        manager.durable = False
 
+        print(f"\nDemo directory: {demo_dir}")
+        print(f"Career data file: {demo_career_file}")
 
-def main():
-    """Run all demos."""
-    print("\n" + "=" * 70)
-    print("  RESUME TAILOR - INTERACTIVE DISCOVERY SYSTEM")
-    print("  Live Demo")
-    print("=" * 70)
-    print(f"\nDemo directory: {demo_dir}")
-    print(f"Career data file: {demo_career_file}")
-
-    try:
         demo_skill_detection()
         demo_validation_good_example()
         demo_validation_bad_example()
         demo_data_enrichment()
 
-        print("\n" + "=" * 70)
-        print("  DEMO COMPLETE")
-        print("=" * 70)
+        print_header("DEMO COMPLETE")
         print("\nKey Takeaways:")
         print("  1. Skill detection finds relevant skills from job descriptions")
         print("  2. Multi-layer validation prevents hallucinations")
@@ -302,11 +308,12 @@ def main():
         print("  5. All data is user-provided and validated")
         print("\n[SUCCESS] Discovery system ready for production use!")
 
-    finally:
-        # Cleanup
-        shutil.rmtree(demo_dir)
-        print(f"\nCleanup: Removed demo directory")
+    print(f"\nCleanup: Removed demo directory")
 
 
 if __name__ == '__main__':
+    # On a console stdout flushes after every line; the demo prints ~150
+    # lines, so let it buffer in blocks (flushed at exit) instead
+    if getattr(sys.stdout, 'line_buffering', False):
+        sys.stdout.reconfigure(line_buffering=False)
     main()
@@ -6,8 +6,11 @@ Prevents hallucinations through structured, mandatory input fields.
 """
 
 import tkinter as tk
+from dataclasses import dataclass
+from functools import lru_cache
+from tkinter import font as tkfont
 from tkinter import scrolledtext, messagebox
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List, Tuple
 
 from models import DiscoveredSkill
 from career_discovery import (
@@ -17,6 +20,150 @@ from career_discovery import (
 )
 
 
+def _is_yyyy_mm(value: str) -> bool:
+    """Check for the fixed YYYY-MM shape (e.g. "2023-06")."""
+    # isdecimal() matches the same characters as \d in a str regex
+    return (
+        len(value) == 7
+        and value[4] == '-'
+        and value[:4].isdecimal()
+        and value[5:].isdecimal()
+    )
+
+
+# Step prompts that mention the skill, formatted once per dialog
+_STEP1_Q = "Do you have experience with {skill}?"
+_STEP2_Q = "Which company or project did you use {skill}?"
+_STEP4_Q = "Describe a specific example of using {skill}"
+
+# Step 1 answers as (label, value); "ignore" is added separately in warning color
+_STEP1_CHOICES = (
+    ("Yes, I've used it professionally", "yes"),
+    ("Yes, in side projects only", "side"),
+    ("No / Not sure", "no"),
+)
+
+# Error code from _check_timeframe -> (title, message) for the error box
+_TIMEFRAME_ERRORS = {
+    "start": (
+        "Invalid Format",
+        "Start date must be in YYYY-MM format.\n\n"
+        "Example: 2023-06"
+    ),
+    "end": (
+        "Invalid Format",
+        'End date must be in YYYY-MM format or "Present".\n\n'
+        "Example: 2024-03 or Present"
+    ),
+}
+
+
+def _check_timeframe(start: str, end: str) -> Optional[str]:
+    """
+    Check a step 3 timeframe.
+
+    Returns:
+        None if valid, otherwise the key of the failing field
+        in _TIMEFRAME_ERRORS ("start" or "end")
+    """
+    if not _is_yyyy_mm(start):
+        return "start"
+    if end != "Present" and not _is_yyyy_mm(end):
+        return "end"
+    return None
+
+
+# Review dialog header box
+_REVIEW_BANNER = (
+    "╔" + "═" * 59 + "╗\n"
+    "║" + "REVIEW BEFORE SAVING".center(59) + "║\n"
+    "╚" + "═" * 59 + "╝"
+)
+
+# Horizontal rule used between review sections
+_HR = "─" * 60
+_HR_NL = _HR + "\n"
+
+
+@dataclass(frozen=True)
+class _Theme:
+    """Colors and fonts shared by the discovery dialogs (matching main GUI theme)."""
+    bg_color: str = "#1a1a1a"
+    fg_color: str = "#00ff00"
+    text_bg: str = "#0d0d0d"
+    accent_color: str = "#00aaff"
+    error_color: str = "#ff0000"
+    warning_color: str = "#ffaa00"
+
+    mono_family: str = "Courier New"
+    mono_size: int = 10
+
+    # Named Tk fonts, registered by _add_theme_options
+    mono_font: str = "DiscoveryMono"
+    mono_font_bold: str = "DiscoveryMonoBold"
+
+
+_THEME = _Theme()
+
+# Window class of both dialogs; scopes the option defaults below to them
+_DIALOG_CLASS = "DiscoveryDialog"
+
+# Option database defaults, so widgets only pass the options they override
+_THEME_OPTIONS = (
+    ("Frame.background", _THEME.bg_color),
+    ("Label.background", _THEME.bg_color),
+    ("Label.foreground", _THEME.fg_color),
+    ("Label.font", _THEME.mono_font),
+    ("Entry.background", _THEME.text_bg),
+    ("Entry.foreground", _THEME.fg_color),
+    ("Entry.insertBackground", _THEME.fg_color),
+    ("Entry.font", _THEME.mono_font),
+    ("Radiobutton.background", _THEME.bg_color),
+    ("Radiobutton.foreground", _THEME.fg_color),
+    ("Radiobutton.selectColor", _THEME.text_bg),
+    ("Radiobutton.activeBackground", _THEME.bg_color),
+    ("Radiobutton.font", _THEME.mono_font),
+    ("Button.background", _THEME.bg_color),
+    ("Button.foreground", _THEME.fg_color),
+    ("Button.font", _THEME.mono_font),
+)
+
+
+# Keeps the named fonts alive; Tk deletes them when their Font object is freed
+_named_fonts: List[tkfont.Font] = []
+
+
+def _add_theme_options(widget: tk.Misc):
+    """Register the dialog theme fonts and Tk option database defaults."""
+    # Fonts are resolved once by name instead of parsing a tuple per widget
+    if _THEME.mono_font not in tkfont.names(widget):
+        _named_fonts[:] = [
+            tkfont.Font(
+                root=widget, name=_THEME.mono_font,
+                family=_THEME.mono_family, size=_THEME.mono_size
+            ),
+            tkfont.Font(
+                root=widget, name=_THEME.mono_font_bold,
+                family=_THEME.mono_family, size=_THEME.mono_size, weight="bold"
+            ),
+        ]
+
+    for pattern, value in _THEME_OPTIONS:
+        widget.option_add(f"*{_DIALOG_CLASS}*{pattern}", value)
+
+
+@lru_cache(maxsize=128)
+def _cached_hallucinations(example: str, job_description: str) -> Tuple[str, ...]:
+    """
+    detect_hallucinations() memoized on its inputs.
+
+    Safe to cache because the check is a pure function of the two strings.
+    validate_discovered_skill() is not cached: it reads the saved career data
+    and the current date, both of which change between reviews.
+    """
+    return tuple(detect_hallucinations(example, job_description))
+
+
 class MultiStepDiscoveryDialog:
     """
     Multi-step dialog for discovering new skills.
@@ -57,25 +204,28 @@ class MultiStepDiscoveryDialog:
         self.current_step = 1
         self.max_steps = 5
 
-        # Colors (matching main GUI theme)
-        self.bg_color = "#1a1a1a"
-        self.fg_color = "#00ff00"
-        self.text_bg = "#0d0d0d"
-        self.accent_color = "#00aaff"
-        self.error_color = "#ff0000"
-        self.warning_color = "#ffaa00"
+        # Step prompts (skill_name is fixed for the dialog's lifetime)
+        self._texts = {
+            1: _STEP1_Q.format(skill=skill_name),
+            2: _STEP2_Q.format(skill=skill_name),
+            4: _STEP4_Q.format(skill=skill_name)
+        }
+
+        # Step frames, built lazily and reused on Back/Next
+        self._step_frames: Dict[int, tk.Frame] = {}
 
-        self.mono_font = ("Courier New", 10)
-        self.mono_font_bold = ("Courier New", 10, "bold")
+        # Pending after_idle job for the step 4 character counter
+        self._pending_count_job = None
 
         self._create_dialog()
 
     def _create_dialog(self):
         """Create the main dialog window."""
-        self.dialog = tk.Toplevel(self.parent)
+        self.dialog = tk.Toplevel(self.parent, class_=_DIALOG_CLASS)
+        _add_theme_options(self.dialog)
         self.dialog.title(f"Add Skill: {self.skill_name}")
         self.dialog.geometry("700x500")
-        self.dialog.configure(bg=self.bg_color)
+        self.dialog.configure(bg=_THEME.bg_color)
         self.dialog.transient(self.parent)
         self.dialog.grab_set()
 
@@ -83,26 +233,24 @@ class MultiStepDiscoveryDialog:
         self.header_label = tk.Label(
             self.dialog,
             text=f"",
-            font=self.mono_font_bold,
-            fg=self.accent_color,
-            bg=self.bg_color
+            font=_THEME.mono_font_bold,
+            fg=_THEME.accent_color
         )
         self.header_label.pack(pady=10)
 
-        # Content frame (will be replaced for each step)
-        self.content_frame = tk.Frame(self.dialog, bg=self.bg_color)
+        # Content frame (holds one frame per step, built on first visit)
+        self.content_frame = tk.Frame(self.dialog)
         self.content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
         # Navigation buttons
-        nav_frame = tk.Frame(self.dialog, bg=self.bg_color)
+        nav_frame = tk.Frame(self.dialog)
         nav_frame.pack(pady=10)
 
         self.back_btn = tk.Button(
             nav_frame,
             text="<< Back",
-            font=self.mono_font,
-            fg=self.bg_color,
-            bg=self.fg_color,
+            fg=_THEME.bg_color,
+            bg=_THEME.fg_color,
             command=self._go_back,
             state=tk.DISABLED
         )
@@ -111,9 +259,9 @@ class MultiStepDiscoveryDialog:
         self.next_btn = tk.Button(
             nav_frame,
             text="Next >>",
-            font=self.mono_font_bold,
-            fg=self.bg_color,
-            bg=self.accent_color,
+            font=_THEME.mono_font_bold,
+            fg=_THEME.bg_color,
+            bg=_THEME.accent_color,
             command=self._go_next
         )
         self.next_btn.pack(side=tk.LEFT, padx=5)
@@ -121,9 +269,6 @@ class MultiStepDiscoveryDialog:
         self.skip_btn = tk.Button(
             nav_frame,
             text="Skip",
-            font=self.mono_font,
-            fg=self.fg_color,
-            bg=self.bg_color,
             command=self._handle_skip
         )
         self.skip_btn.pack(side=tk.LEFT, padx=5)
@@ -135,26 +280,26 @@ class MultiStepDiscoveryDialog:
         """Display the specified step."""
         self.current_step = step
 
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        # Hide the previous step; its widgets (and their contents) are kept
+        for frame in self._step_frames.values():
+            frame.pack_forget()
 
         # Update header
         self.header_label.config(
             text=f"Step {step}/{self.max_steps}: Adding '{self.skill_name}'"
         )
 
-        # Show appropriate step
-        if step == 1:
-            self._show_step1_confirm()
-        elif step == 2:
-            self._show_step2_company()
-        elif step == 3:
-            self._show_step3_timeframe()
-        elif step == 4:
-            self._show_step4_example()
-        elif step == 5:
-            self._show_step5_result()
+        # Build each step's widgets the first time it is shown
+        frame = self._step_frames.get(step)
+        if frame is None:
+            frame = tk.Frame(self.content_frame)
+            self._step_frames[step] = frame
+            self._build_step(step, frame)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        # Focus on every visit, not just when the frame is first built
+        if step == 2:
+            self.company_entry.focus()
 
         # Update navigation buttons
         self.back_btn.config(state=tk.NORMAL if step > 1 else tk.DISABLED)
@@ -162,14 +307,25 @@ class MultiStepDiscoveryDialog:
             text="Finish" if step == self.max_steps else "Next >>"
         )
 
-    def _show_step1_confirm(self):
+    def _build_step(self, step: int, parent: tk.Frame):
+        """Create the widgets for a step inside parent."""
+        if step == 1:
+            self._show_step1_confirm(parent)
+        elif step == 2:
+            self._show_step2_company(parent)
+        elif step == 3:
+            self._show_step3_timeframe(parent)
+        elif step == 4:
+            self._show_step4_example(parent)
+        elif step == 5:
+            self._show_step5_result(parent)
+
+    def _show_step1_confirm(self, parent: tk.Frame):
         """Step 1: Confirm experience."""
         tk.Label(
-            self.content_frame,
-            text=f"Do you have experience with {self.skill_name}?",
-            font=self.mono_font_bold,
-            fg=self.fg_color,
-            bg=self.bg_color,
+            parent,
+            text=self._texts[1],
+            font=_THEME.mono_font_bold,
             justify=tk.LEFT
         ).pack(pady=20)
 
@@ -178,20 +334,16 @@ class MultiStepDiscoveryDialog:
             context = get_skill_context(self.skill_name, self.job_description)
             if context:
                 tk.Label(
-                    self.content_frame,
+                    parent,
                     text="Context from job description:",
-                    font=self.mono_font,
-                    fg=self.warning_color,
-                    bg=self.bg_color,
+                    fg=_THEME.warning_color,
                     justify=tk.LEFT
                 ).pack(pady=(0, 5))
 
                 context_label = tk.Label(
-                    self.content_frame,
+                    parent,
                     text=context,
-                    font=self.mono_font,
-                    fg=self.accent_color,
-                    bg=self.bg_color,
+                    fg=_THEME.accent_color,
                     justify=tk.LEFT,
                     wraplength=600
                 )
@@ -199,242 +351,186 @@ class MultiStepDiscoveryDialog:
 
         self.experience_var = tk.StringVar(value="yes")
 
-        tk.Radiobutton(
-            self.content_frame,
-            text="Yes, I've used it professionally",
-            variable=self.experience_var,
-            value="yes",
-            font=self.mono_font,
-            fg=self.fg_color,
-            bg=self.bg_color,
-            selectcolor=self.text_bg,
-            activebackground=self.bg_color
-        ).pack(anchor=tk.W, padx=40, pady=5)
-
-        tk.Radiobutton(
-            self.content_frame,
-            text="Yes, in side projects only",
-            variable=self.experience_var,
-            value="side",
-            font=self.mono_font,
-            fg=self.fg_color,
-            bg=self.bg_color,
-            selectcolor=self.text_bg,
-            activebackground=self.bg_color
-        ).pack(anchor=tk.W, padx=40, pady=5)
+        for text, value in _STEP1_CHOICES:
+            tk.Radiobutton(
+                parent,
+                text=text,
+                variable=self.experience_var,
+                value=value
+            ).pack(anchor=tk.W, padx=40, pady=5)
 
         tk.Radiobutton(
-            self.content_frame,
-            text="No / Not sure",
-            variable=self.experience_var,
-            value="no",
-            font=self.mono_font,
-            fg=self.fg_color,
-            bg=self.bg_color,
-            selectcolor=self.text_bg,
-            activebackground=self.bg_color
-        ).pack(anchor=tk.W, padx=40, pady=5)
-
-        tk.Radiobutton(
-            self.content_frame,
+            parent,
             text="Ignore - this isn't a skill",
             variable=self.experience_var,
             value="ignore",
-            font=self.mono_font,
-            fg=self.warning_color,
-            bg=self.bg_color,
-            selectcolor=self.text_bg,
-            activebackground=self.bg_color
+            fg=_THEME.warning_color
         ).pack(anchor=tk.W, padx=40, pady=5)
 
-    def _show_step2_company(self):
+    def _show_step2_company(self, parent: tk.Frame):
         """Step 2: Company/Project (required)."""
         tk.Label(
-            self.content_frame,
-            text=f"Which company or project did you use {self.skill_name}?",
-            font=self.mono_font_bold,
-            fg=self.fg_color,
-            bg=self.bg_color
+            parent,
+            text=self._texts[2],
+            font=_THEME.mono_font_bold
         ).pack(pady=10)
 
         tk.Label(
-            self.content_frame,
+            parent,
             text='Example: "Acme Corp" or "Personal Project: Portfolio Site"',
-            font=self.mono_font,
-            fg=self.warning_color,
-            bg=self.bg_color
+            fg=_THEME.warning_color
         ).pack(pady=5)
 
         self.company_entry = tk.Entry(
-            self.content_frame,
-            font=self.mono_font,
-            bg=self.text_bg,
-            fg=self.fg_color,
-            insertbackground=self.fg_color,
+            parent,
             width=50
         )
         self.company_entry.pack(pady=10)
-        self.company_entry.insert(0, self.company)
-        self.company_entry.focus()
 
-    def _show_step3_timeframe(self):
+    def _show_step3_timeframe(self, parent: tk.Frame):
         """Step 3: Timeframe (YYYY-MM format)."""
         tk.Label(
-            self.content_frame,
+            parent,
             text="What timeframe? (YYYY-MM format)",
-            font=self.mono_font_bold,
-            fg=self.fg_color,
-            bg=self.bg_color
+            font=_THEME.mono_font_bold
         ).pack(pady=10)
 
         # Start date
-        start_frame = tk.Frame(self.content_frame, bg=self.bg_color)
+        start_frame = tk.Frame(parent)
         start_frame.pack(pady=5)
 
         tk.Label(
             start_frame,
-            text="Start:",
-            font=self.mono_font,
-            fg=self.fg_color,
-            bg=self.bg_color
+            text="Start:"
         ).pack(side=tk.LEFT, padx=5)
 
         self.start_entry = tk.Entry(
             start_frame,
-            font=self.mono_font,
-            bg=self.text_bg,
-            fg=self.fg_color,
-            insertbackground=self.fg_color,
             width=10
         )
         self.start_entry.pack(side=tk.LEFT)
-        self.start_entry.insert(0, self.timeframe_start)
 
         tk.Label(
             start_frame,
             text="(e.g., 2023-06)",
-            font=self.mono_font,
-            fg=self.warning_color,
-            bg=self.bg_color
+            fg=_THEME.warning_color
         ).pack(side=tk.LEFT, padx=10)
 
         # End date
-        end_frame = tk.Frame(self.content_frame, bg=self.bg_color)
+        end_frame = tk.Frame(parent)
         end_frame.pack(pady=5)
 
         tk.Label(
             end_frame,
-            text="End:  ",
-            font=self.mono_font,
-            fg=self.fg_color,
-            bg=self.bg_color
+            text="End:  "
         ).pack(side=tk.LEFT, padx=5)
 
         self.end_entry = tk.Entry(
             end_frame,
-            font=self.mono_font,
-            bg=self.text_bg,
-            fg=self.fg_color,
-            insertbackground=self.fg_color,
             width=10
         )
         self.end_entry.pack(side=tk.LEFT)
-        self.end_entry.insert(0, self.timeframe_end)
 
         tk.Label(
             end_frame,
             text='(or "Present")',
-            font=self.mono_font,
-            fg=self.warning_color,
-            bg=self.bg_color
+            fg=_THEME.warning_color
         ).pack(side=tk.LEFT, padx=10)
 
-    def _show_step4_example(self):
+    def _show_step4_example(self, parent: tk.Frame):
         """Step 4: Specific example (min 20 chars, required)."""
         tk.Label(
-            self.content_frame,
-            text=f"Describe a specific example of using {self.skill_name}",
-            font=self.mono_font_bold,
-            fg=self.fg_color,
-            bg=self.bg_color
+            parent,
+            text=self._texts[4],
+            font=_THEME.mono_font_bold
         ).pack(pady=10)
 
         tk.Label(
-            self.content_frame,
+            parent,
             text="Minimum 20 characters. Be specific and concrete.",
-            font=self.mono_font,
-            fg=self.warning_color,
-            bg=self.bg_color
+            fg=_THEME.warning_color
         ).pack(pady=5)
 
         self.example_text = scrolledtext.ScrolledText(
-            self.content_frame,
+            parent,
             height=8,
-            font=self.mono_font,
-            bg=self.text_bg,
-            fg=self.fg_color,
-            insertbackground=self.fg_color,
+            font=_THEME.mono_font,
+            bg=_THEME.text_bg,
+            fg=_THEME.fg_color,
+            insertbackground=_THEME.fg_color,
             wrap=tk.WORD
         )
         self.example_text.pack(fill=tk.BOTH, expand=True, pady=10)
-        self.example_text.insert('1.0', self.example)
 
         # Character counter
         self.char_count_label = tk.Label(
-            self.content_frame,
+            parent,
             text="0 / 500 characters (min 20)",
-            font=self.mono_font,
-            fg=self.warning_color,
-            bg=self.bg_color
+            fg=_THEME.warning_color
         )
         self.char_count_label.pack()
 
-        def update_char_count(*args):
-            text = self.example_text.get('1.0', tk.END).strip()
-            count = len(text)
-            color = self.fg_color if count >= 20 else self.error_color
-            self.char_count_label.config(
-                text=f"{count} / 500 characters (min 20)",
-                fg=color
-            )
+        # <<Modified>> also catches paste/cut with the mouse, which KeyRelease missed
+        self.example_text.bind('<<Modified>>', self._schedule_char_count)
+        self._update_char_count()
 
-        self.example_text.bind('<KeyRelease>', update_char_count)
-        update_char_count()
+    def _schedule_char_count(self, event=None):
+        """Queue one counter refresh for the next idle turn."""
+        # <<Modified>> also fires when the flag is reset below
+        if not self.example_text.edit_modified():
+            return
+        self.example_text.edit_modified(False)
+
+        # A burst of edits (fast typing, paste) collapses into a single update
+        if self._pending_count_job is None:
+            self._pending_count_job = self.dialog.after_idle(self._update_char_count)
+
+    def _update_char_count(self):
+        """Refresh the step 4 character counter."""
+        self._pending_count_job = None
+        if not self.char_count_label.winfo_exists():
+            return  # Finish handed the window to ReviewDialog, which cleared it
+
+        # Count what _validate_current_step counts (the stripped text) without
+        # copying the buffer out: locate the first and last non-whitespace
+        # characters with Tk searches and count the span between them
+        first = self.example_text.search(r'\S', '1.0', 'end', regexp=True)
+        if first:
+            last = self.example_text.search(r'\S', 'end', '1.0', regexp=True, backwards=True)
+            count = self.example_text.count(first, f'{last}+1c', 'chars')[0]
+        else:
+            count = 0
+        color = _THEME.fg_color if count >= 20 else _THEME.error_color
+        self.char_count_label.config(
+            text=f"{count} / 500 characters (min 20)",
+            fg=color
+        )
 
-    def _show_step5_result(self):
+    def _show_step5_result(self, parent: tk.Frame):
         """Step 5: Measurable result (optional)."""
         tk.Label(
-            self.content_frame,
+            parent,
             text="What was the measurable result? (Optional)",
-            font=self.mono_font_bold,
-            fg=self.fg_color,
-            bg=self.bg_color
+            font=_THEME.mono_font_bold
         ).pack(pady=10)
 
         tk.Label(
-            self.content_frame,
+            parent,
             text='Examples: "40% faster deployments", "99.9% uptime", "Saved $50K annually"',
-            font=self.mono_font,
-            fg=self.warning_color,
-            bg=self.bg_color
+            fg=_THEME.warning_color
         ).pack(pady=5)
 
         self.result_entry = tk.Entry(
-            self.content_frame,
-            font=self.mono_font,
-            bg=self.text_bg,
-            fg=self.fg_color,
-            insertbackground=self.fg_color,
+            parent,
             width=50
         )
         self.result_entry.pack(pady=10)
-        self.result_entry.insert(0, self.result)
 
     def _go_back(self):
         """Go to previous step."""
         if self.current_step > 1:
             # Save current data
-            self._save_current_step()
+            self._save_current_step(self._read_current_step())
             # Show previous step
             self._show_step(self.current_step - 1)
 
@@ -446,12 +542,15 @@ class MultiStepDiscoveryDialog:
 
     def _go_next(self):
         """Go to next step or finish."""
+        # Read the step's fields once for both validation and saving
+        values = self._read_current_step()
+
         # Validate current step
-        if not self._validate_current_step():
+        if not self._validate_current_step(values):
             return
 
         # Save current data
-        self._save_current_step()
+        self._save_current_step(values)
 
         if self.current_step == self.max_steps:
             # Finish - show review dialog
@@ -460,26 +559,41 @@ class MultiStepDiscoveryDialog:
             # Next step
             self._show_step(self.current_step + 1)
 
-    def _save_current_step(self):
+    def _read_current_step(self) -> Dict[str, str]:
+        """Read (and strip) the current step's input fields."""
+        if self.current_step == 1:
+            return {'experience': self.experience_var.get()}
+        elif self.current_step == 2:
+            return {'company': self.company_entry.get().strip()}
+        elif self.current_step == 3:
+            return {
+                'start': self.start_entry.get().strip(),
+                'end': self.end_entry.get().strip()
+            }
+        elif self.current_step == 4:
+            return {'example': self.example_text.get('1.0', tk.END).strip()}
+        elif self.current_step == 5:
+            return {'result': self.result_entry.get().strip()}
+        return {}
+
+    def _save_current_step(self, values: Dict[str, str]):
         """Save data from current step."""
         if self.current_step == 1:
-            self.has_experience = self.experience_var.get()
+            self.has_experience = values['experience']
         elif self.current_step == 2:
-            self.company = self.company_entry.get().strip()
+            self.company = values['company']
         elif self.current_step == 3:
-            self.timeframe_start = self.start_entry.get().strip()
-            self.timeframe_end = self.end_entry.get().strip()
+            self.timeframe_start = values['start']
+            self.timeframe_end = values['end']
         elif self.current_step == 4:
-            self.example = self.example_text.get('1.0', tk.END).strip()
+            self.example = values['example']
         elif self.current_step == 5:
-            self.result = self.result_entry.get().strip()
+            self.result = values['result']
 
-    def _validate_current_step(self) -> bool:
-        """Validate current step data."""
+    def _validate_current_step(self, values: Dict[str, str]) -> bool:
+        """Validate current step data (as returned by _read_current_step)."""
         if self.current_step == 1:
-            if not hasattr(self, 'experience_var'):
-                return True
-            if self.experience_var.get() == "no":
+            if values['experience'] == "no":
                 messagebox.showinfo(
                     "No Experience",
                     f"Okay, we won't add {self.skill_name} to your career data."
@@ -489,7 +603,7 @@ class MultiStepDiscoveryDialog:
                     self.on_skip(self.skill_name)
                 self.dialog.destroy()
                 return False
-            elif self.experience_var.get() == "ignore":
+            elif values['experience'] == "ignore":
                 messagebox.showinfo(
                     "Ignored",
                     f"'{self.skill_name}' will be permanently ignored.\n\n"
@@ -502,7 +616,7 @@ class MultiStepDiscoveryDialog:
                 return False
 
         elif self.current_step == 2:
-            company = self.company_entry.get().strip()
+            company = values['company']
             if not company or len(company) < 2:
                 messagebox.showerror(
                     "Company Required",
@@ -512,31 +626,14 @@ class MultiStepDiscoveryDialog:
                 return False
 
         elif self.current_step == 3:
-            start = self.start_entry.get().strip()
-            end = self.end_entry.get().strip()
-
             # Validate format
-            import re
-            pattern = r'^\d{4}-\d{2}$'
-
-            if not re.match(pattern, start):
-                messagebox.showerror(
-                    "Invalid Format",
-                    "Start date must be in YYYY-MM format.\n\n"
-                    "Example: 2023-06"
-                )
-                return False
-
-            if end != "Present" and not re.match(pattern, end):
-                messagebox.showerror(
-                    "Invalid Format",
-                    'End date must be in YYYY-MM format or "Present".\n\n'
-                    "Example: 2024-03 or Present"
-                )
+            error = _check_timeframe(values['start'], values['end'])
+            if error:
+                messagebox.showerror(*_TIMEFRAME_ERRORS[error])
                 return False
 
         elif self.current_step == 4:
-            example = self.example_text.get('1.0', tk.END).strip()
+            example = values['example']
 
             if len(example) < 20:
                 messagebox.showerror(
@@ -572,15 +669,13 @@ class MultiStepDiscoveryDialog:
                 category="technical"
             )
 
-            # Close this dialog
-            self.dialog.destroy()
-
-            # Show review dialog
+            # Show review dialog in this dialog's window
             ReviewDialog(
                 self.parent,
                 discovered,
                 self.job_description,
-                on_save=self.on_complete
+                on_save=self.on_complete,
+                reuse_toplevel=self.dialog
             )
 
         except Exception as e:
@@ -598,139 +693,159 @@ class ReviewDialog:
         parent,
         discovered: DiscoveredSkill,
         job_description: str = "",
-        on_save: Optional[Callable] = None
+        on_save: Optional[Callable] = None,
+        reuse_toplevel: Optional[tk.Toplevel] = None
     ):
+        """
+        Args:
+            reuse_toplevel: Existing dialog window (e.g. the discovery wizard)
+                to show the review in instead of opening a new one. Its
+                widgets are replaced; it must already be themed and grabbed.
+        """
         self.parent = parent
         self.discovered = discovered
         self.job_description = job_description
         self.on_save = on_save
 
-        # Colors
-        self.bg_color = "#1a1a1a"
-        self.fg_color = "#00ff00"
-        self.text_bg = "#0d0d0d"
-        self.accent_color = "#00aaff"
-        self.error_color = "#ff0000"
-        self.warning_color = "#ffaa00"
-
-        self.mono_font = ("Courier New", 10)
-        self.mono_font_bold = ("Courier New", 10, "bold")
-
-        self._create_dialog()
+        self._create_dialog(reuse_toplevel)
 
-    def _create_dialog(self):
+    def _create_dialog(self, reuse_toplevel: Optional[tk.Toplevel] = None):
         """Create review dialog."""
-        self.dialog = tk.Toplevel(self.parent)
+        if reuse_toplevel is not None:
+            self.dialog = reuse_toplevel
+            for widget in self.dialog.winfo_children():
+                widget.destroy()
+        else:
+            self.dialog = tk.Toplevel(self.parent, class_=_DIALOG_CLASS)
+            _add_theme_options(self.dialog)
+            self.dialog.configure(bg=_THEME.bg_color)
+            self.dialog.transient(self.parent)
+            self.dialog.grab_set()
+
         self.dialog.title("Review Before Saving")
         self.dialog.geometry("700x600")
-        self.dialog.configure(bg=self.bg_color)
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
 
         # Header
         tk.Label(
             self.dialog,
-            text="╔═══════════════════════════════════════════════════════════╗\n"
-                 "║          REVIEW BEFORE SAVING                         ║\n"
-                 "╚═══════════════════════════════════════════════════════════╝",
-            font=self.mono_font_bold,
-            fg=self.accent_color,
-            bg=self.bg_color,
+            text=_REVIEW_BANNER,
+            font=_THEME.mono_font_bold,
+            fg=_THEME.accent_color,
             justify=tk.LEFT
         ).pack(pady=10)
 
-        # Content area
-        content_text = scrolledtext.ScrolledText(
-            self.dialog,
+        # Content area (a scrollbar is added only if the text overflows)
+        self.content_frame = tk.Frame(self.dialog)
+        self.content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+
+        self.content_text = tk.Text(
+            self.content_frame,
             height=20,
-            font=self.mono_font,
-            bg=self.text_bg,
-            fg=self.fg_color,
+            font=_THEME.mono_font,
+            bg=_THEME.text_bg,
+            fg=_THEME.fg_color,
             state=tk.DISABLED
         )
-        content_text.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        self.content_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        # Build review content
-        review_text = self._build_review_text()
+        # Show the proposed addition now; the checks fill in once the
+        # dialog has been drawn
+        self.content_text.config(state=tk.NORMAL)
+        self.content_text.insert('1.0', self._build_static_review_text())
+        self._checks_index = self.content_text.index('end-1c')
+        self.content_text.insert(tk.END, "Running checks...\n")
+        self.content_text.config(state=tk.DISABLED)
 
-        content_text.config(state=tk.NORMAL)
-        content_text.insert('1.0', review_text)
-        content_text.config(state=tk.DISABLED)
+        self.dialog.after(1, self._run_validations_and_append)
 
         # Buttons
-        btn_frame = tk.Frame(self.dialog, bg=self.bg_color)
+        btn_frame = tk.Frame(self.dialog)
         btn_frame.pack(pady=10)
 
         tk.Button(
             btn_frame,
             text="Save to Career Data",
-            font=self.mono_font_bold,
-            fg=self.bg_color,
-            bg=self.accent_color,
+            font=_THEME.mono_font_bold,
+            fg=_THEME.bg_color,
+            bg=_THEME.accent_color,
             command=self._save
         ).pack(side=tk.LEFT, padx=5)
 
         tk.Button(
             btn_frame,
             text="Edit",
-            font=self.mono_font,
-            fg=self.bg_color,
-            bg=self.fg_color,
+            fg=_THEME.bg_color,
+            bg=_THEME.fg_color,
             command=self._edit
         ).pack(side=tk.LEFT, padx=5)
 
         tk.Button(
             btn_frame,
             text="Discard",
-            font=self.mono_font,
-            fg=self.fg_color,
-            bg=self.bg_color,
             command=self.dialog.destroy
         ).pack(side=tk.LEFT, padx=5)
 
-    def _build_review_text(self) -> str:
-        """Build review text with validation results."""
-        text = "PROPOSED ADDITION\n"
-        text += "─" * 60 + "\n\n"
-
-        text += f"Skill: {self.discovered.name}\n"
-        text += f"Company: {self.discovered.company}\n"
-        text += f"Timeframe: {self.discovered.timeframe}\n\n"
-
-        text += "Example:\n"
-        text += f"{self.discovered.example}\n\n"
+    def _build_static_review_text(self) -> str:
+        """Build the proposed-addition section of the review text."""
+        parts = [
+            "PROPOSED ADDITION\n",
+            _HR_NL, "\n",
+            f"Skill: {self.discovered.name}\n",
+            f"Company: {self.discovered.company}\n",
+            f"Timeframe: {self.discovered.timeframe}\n\n",
+            "Example:\n",
+            f"{self.discovered.example}\n\n",
+        ]
 
         if self.discovered.result:
-            text += f"Result: {self.discovered.result}\n\n"
+            parts.append(f"Result: {self.discovered.result}\n\n")
+
+        parts += [_HR_NL, "VALIDATION CHECKS\n", _HR_NL, "\n"]
 
-        text += "─" * 60 + "\n"
-        text += "VALIDATION CHECKS\n"
-        text += "─" * 60 + "\n\n"
+        return "".join(parts)
 
-        # Run validations
+    def _build_validation_text(self) -> str:
+        """Run validations and build the validation-checks section."""
         validation = validate_discovered_skill(self.discovered)
-        hallucinations = detect_hallucinations(
+        hallucinations = _cached_hallucinations(
             self.discovered.example,
             self.job_description
         )
 
         # Show results
         if validation['valid'] and not hallucinations:
-            text += "[OK] All checks passed\n"
-        else:
-            if validation['errors']:
-                for error in validation['errors']:
-                    text += f"[ERROR] {error}\n"
+            return "[OK] All checks passed\n"
 
-            if validation['warnings']:
-                for warning in validation['warnings']:
-                    text += f"[WARN] {warning}\n"
+        parts = [f"[ERROR] {error}\n" for error in validation['errors']]
+        parts += [f"[WARN] {warning}\n" for warning in validation['warnings']]
+        parts += [f"[WARN] {warning}\n" for warning in hallucinations]
 
-            if hallucinations:
-                for warning in hallucinations:
-                    text += f"[WARN] {warning}\n"
+        return "".join(parts)
+
+    def _run_validations_and_append(self):
+        """Replace the placeholder with validation results."""
+        if not self.dialog.winfo_exists():
+            return  # Closed before the checks ran
+
+        validation_text = self._build_validation_text()
+
+        self.content_text.config(state=tk.NORMAL)
+        self.content_text.delete(self._checks_index, tk.END)
+        self.content_text.insert(tk.END, validation_text)
+        self.content_text.config(state=tk.DISABLED)
+
+        self._add_scrollbar_if_needed()
+
+    def _add_scrollbar_if_needed(self):
+        """Attach a scrollbar if the review text doesn't fit in the text box."""
+        # Wrapped lines count too, so ask Tk after layout instead of counting "\n"
+        self.content_text.update_idletasks()
+        if self.content_text.yview() == (0.0, 1.0):
+            return
 
-        return text
+        scrollbar = tk.Scrollbar(self.content_frame, command=self.content_text.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, before=self.content_text)
+        self.content_text.config(yscrollcommand=scrollbar.set)
 
     def _save(self):
         """Save discovered skill to career data."""
@@ -6,23 +6,72 @@ Uses python-docx library for clean, ATS-friendly formatting.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import BinaryIO, Callable, Dict, Any, List, Optional, Tuple, Union
+import copy
+import io
 import re
 
 # Import config and contact info
 from config import get_contact_info
-from resume_parser import parse_markdown_resume, ResumeData
+from resume_parser import parse_markdown_resume
 CONTACT_INFO = get_contact_info()
 
+# Resume header lines, fixed for the life of the process. linkedin and
+# location are optional in ContactInfo, and a KeyError here would fail the
+# import (generator.py only falls back on ImportError).
+_NAME_UPPER = CONTACT_INFO['name'].upper()
+_CONTACT_LINE = (
+    f"{CONTACT_INFO['phone']} | {CONTACT_INFO['email']} | "
+    f"{CONTACT_INFO.get('linkedin', '')} | {CONTACT_INFO.get('location', '')}"
+)
+
 try:
     from docx import Document
     from docx.shared import Pt, Inches, RGBColor
     from docx.enum.text import WD_ALIGN_PARAGRAPH
     DOCX_AVAILABLE = True
+
+    # Shared lengths and colors (immutable, so one instance serves every run)
+    _PT9, _PT10, _PT11, _PT12, _PT18 = Pt(9), Pt(10), Pt(11), Pt(12), Pt(18)
+    _BLACK = RGBColor(0, 0, 0)
+    _BLUE = RGBColor(37, 99, 235)  # Blue accent
+    _GRAY = RGBColor(102, 102, 102)
+    _HALF_IN = Inches(0.5)
+    _ONE_IN = Inches(1.0)
 except ImportError:
     DOCX_AVAILABLE = False
     print("Warning: python-docx not available. Install with: pip install python-docx")
 
+def _cover_line_kind(line: str) -> Optional[str]:
+    """
+    Classify a stripped cover letter line as 'header', 'bold', 'bullet' or None.
+
+    Only the prefix is compared for headers and bullets. Bold wins over
+    bullet, so "- **x**" is a bold paragraph.
+    """
+    if line[:3] == '## ':
+        return 'header'
+    if '**' in line:
+        return 'bold'
+    if line[:2] == '- ':
+        return 'bullet'
+    return None
+
+
+# Blank document bytes, saved once so later documents skip python-docx's
+# default template file
+_DEFAULT_TEMPLATE_BYTES: Optional[bytes] = None
+
+
+def _new_doc() -> Document:
+    """Create a blank document from the cached default template."""
+    global _DEFAULT_TEMPLATE_BYTES
+    if _DEFAULT_TEMPLATE_BYTES is None:
+        buf = io.BytesIO()
+        Document().save(buf)
+        _DEFAULT_TEMPLATE_BYTES = buf.getvalue()
+    return Document(io.BytesIO(_DEFAULT_TEMPLATE_BYTES))
+
 
 def parse_markdown_to_docx_data(markdown_text: str) -> Dict[str, Any]:
     """
@@ -48,56 +97,54 @@ def parse_markdown_to_docx_data(markdown_text: str) -> Dict[str, Any]:
             for job in resume_data.experience
         ],
         'achievements': resume_data.achievements,
-        'skills': [f"{cat}: {skills}" for cat, skills in resume_data.skills.items()],
+        # Joined here so generate_docx_resume can use the string as-is
+        'skills': ', '.join(f"{cat}: {skills}" for cat, skills in resume_data.skills.items()),
         'education': resume_data.education,
         'certifications': resume_data.certifications
     }
 
 
-def generate_docx_resume(resume_data: Dict[str, Any], output_path: Path) -> Path:
+def generate_docx_resume(
+    resume_data: Dict[str, Any],
+    output_path: Union[Path, BinaryIO]
+) -> Union[Path, BinaryIO]:
     """
     Generate ATS-friendly Word document resume.
 
     Args:
         resume_data: Dictionary with resume sections (name, experience, skills, etc.)
-        output_path: Path to save .docx file
+        output_path: Path to save .docx file, or a writable binary file
+            object (e.g. io.BytesIO) to write it to instead
 
     Returns:
-        Path to generated .docx file
+        output_path
     """
     if not DOCX_AVAILABLE:
         raise ImportError("python-docx is required. Install with: pip install python-docx")
 
-    doc = Document()
+    doc = _new_doc()
 
     # Set document margins (0.5 inch all around for ATS compatibility)
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Inches(0.5)
-        section.bottom_margin = Inches(0.5)
-        section.left_margin = Inches(0.5)
-        section.right_margin = Inches(0.5)
+    # A new Document has exactly one section
+    section = doc.sections[0]
+    section.top_margin = section.bottom_margin = _HALF_IN
+    section.left_margin = section.right_margin = _HALF_IN
+
+    add_bullet = _bullet_adder(doc, _PT10)
 
     # Header: Name (use hardcoded contact info)
     name = doc.add_paragraph()
-    name_run = name.add_run(CONTACT_INFO['name'].upper())
-    name_run.font.size = Pt(18)
-    name_run.font.bold = True
-    name_run.font.color.rgb = RGBColor(0, 0, 0)
+    _styled_run(name, _NAME_UPPER, _PT18, bold=True, color=_BLACK)
     name.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
     # Header: Title
     title = doc.add_paragraph()
-    title_run = title.add_run(resume_data.get('title', 'Senior Product Manager'))
-    title_run.font.size = Pt(12)
-    title_run.font.bold = True
-    title_run.font.color.rgb = RGBColor(37, 99, 235)  # Blue accent
+    _styled_run(title, resume_data.get('title', 'Senior Product Manager'), _PT12, bold=True, color=_BLUE)
     title.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
     # Header: Contact Info (use hardcoded contact info)
-    contact_text = f"{CONTACT_INFO['phone']} | {CONTACT_INFO['email']} | {CONTACT_INFO['linkedin']} | {CONTACT_INFO['location']}"
-    contact = doc.add_paragraph(contact_text)
-    contact.runs[0].font.size = Pt(10)
+    contact = doc.add_paragraph()
+    _styled_run(contact, _CONTACT_LINE)
     contact.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
     # Add spacing after header
@@ -106,8 +153,7 @@ def generate_docx_resume(resume_data: Dict[str, Any], output_path: Path) -> Path
     # Professional Summary
     if resume_data.get('summary'):
         add_section_header(doc, 'PROFESSIONAL SUMMARY')
-        summary_para = doc.add_paragraph(resume_data['summary'])
-        summary_para.runs[0].font.size = Pt(10)
+        _styled_run(doc.add_paragraph(), resume_data['summary'])
         doc.add_paragraph()
 
     # Experience Section
@@ -117,21 +163,13 @@ def generate_docx_resume(resume_data: Dict[str, Any], output_path: Path) -> Path
         for job in resume_data['experience']:
             # Company | Title | Dates
             job_header = doc.add_paragraph()
-            company_run = job_header.add_run(f"{job.get('company', '')} | ")
-            company_run.font.bold = True
-            company_run.font.size = Pt(11)
-
-            title_run = job_header.add_run(f"{job.get('title', '')} | ")
-            title_run.font.size = Pt(11)
-
-            dates_run = job_header.add_run(job.get('dates', ''))
-            dates_run.font.size = Pt(10)
-            dates_run.font.color.rgb = RGBColor(102, 102, 102)  # Gray
+            _styled_run(job_header, f"{job.get('company', '')} | ", _PT11, bold=True)
+            _styled_run(job_header, f"{job.get('title', '')} | ", _PT11)
+            _styled_run(job_header, job.get('dates', ''), color=_GRAY)
 
             # Bullets
             for bullet in job.get('bullets', []):
-                bullet_para = doc.add_paragraph(bullet, style='List Bullet')
-                bullet_para.runs[0].font.size = Pt(10)
+                add_bullet(bullet)
 
             # Add spacing between jobs
             doc.add_paragraph()
@@ -144,16 +182,11 @@ def generate_docx_resume(resume_data: Dict[str, Any], output_path: Path) -> Path
             if isinstance(achievement, dict):
                 # Achievement with title and description
                 ach_para = doc.add_paragraph()
-                title_run = ach_para.add_run(f"{achievement.get('title', '')}: ")
-                title_run.font.bold = True
-                title_run.font.size = Pt(10)
-
-                desc_run = ach_para.add_run(achievement.get('description', ''))
-                desc_run.font.size = Pt(10)
+                _styled_run(ach_para, f"{achievement.get('title', '')}: ", bold=True)
+                _styled_run(ach_para, achievement.get('description', ''))
             else:
                 # Simple achievement string
-                ach_para = doc.add_paragraph(achievement, style='List Bullet')
-                ach_para.runs[0].font.size = Pt(10)
+                add_bullet(achievement)
 
         doc.add_paragraph()
 
@@ -161,10 +194,8 @@ def generate_docx_resume(resume_data: Dict[str, Any], output_path: Path) -> Path
     if resume_data.get('skills'):
         add_section_header(doc, 'SKILLS')
 
-        skills_para = doc.add_paragraph()
         skills_text = ', '.join(resume_data['skills']) if isinstance(resume_data['skills'], list) else resume_data['skills']
-        skills_run = skills_para.add_run(skills_text)
-        skills_run.font.size = Pt(10)
+        _styled_run(doc.add_paragraph(), skills_text)
 
         doc.add_paragraph()
 
@@ -173,20 +204,13 @@ def generate_docx_resume(resume_data: Dict[str, Any], output_path: Path) -> Path
         add_section_header(doc, 'EDUCATION')
 
         edu = resume_data['education']
+        edu_para = doc.add_paragraph()
         if isinstance(edu, dict):
-            edu_para = doc.add_paragraph()
-            degree_run = edu_para.add_run(f"{edu.get('degree', '')}, ")
-            degree_run.font.bold = True
-            degree_run.font.size = Pt(10)
-
-            school_run = edu_para.add_run(f"{edu.get('school', '')}, ")
-            school_run.font.size = Pt(10)
-
-            dates_run = edu_para.add_run(edu.get('dates', ''))
-            dates_run.font.size = Pt(10)
+            _styled_run(edu_para, f"{edu.get('degree', '')}, ", bold=True)
+            _styled_run(edu_para, f"{edu.get('school', '')}, ")
+            _styled_run(edu_para, edu.get('dates', ''))
         else:
-            edu_para = doc.add_paragraph(str(edu))
-            edu_para.runs[0].font.size = Pt(10)
+            _styled_run(edu_para, str(edu))
 
         doc.add_paragraph()
 
@@ -196,101 +220,179 @@ def generate_docx_resume(resume_data: Dict[str, Any], output_path: Path) -> Path
 
         for cert in resume_data['certifications']:
             if isinstance(cert, dict):
-                cert_para = doc.add_paragraph()
-                cert_run = cert_para.add_run(cert.get('title', ''))
-                cert_run.font.bold = True
-                cert_run.font.size = Pt(10)
+                _styled_run(doc.add_paragraph(), cert.get('title', ''), bold=True)
 
                 if cert.get('description'):
-                    desc_para = doc.add_paragraph(cert['description'])
-                    desc_para.runs[0].font.size = Pt(9)
+                    _styled_run(doc.add_paragraph(), cert['description'], _PT9)
             else:
-                cert_para = doc.add_paragraph(cert, style='List Bullet')
-                cert_para.runs[0].font.size = Pt(10)
+                add_bullet(cert)
 
     # Save document
-    doc.save(str(output_path))
+    doc.save(output_path)
     return output_path
 
 
 def add_section_header(doc: Document, text: str):
     """Add a formatted section header to the document."""
-    header = doc.add_paragraph()
-    header_run = header.add_run(text)
-    header_run.font.size = Pt(12)
-    header_run.font.bold = True
-    header_run.font.color.rgb = RGBColor(0, 0, 0)
+    _styled_run(doc.add_paragraph(), text, _PT12, bold=True, color=_BLACK)
+
+
+def _styled_run(para, text: str, size=None, bold: bool = False, color=None):
+    """
+    Add a run of text to a paragraph with the given formatting.
+
+    Args:
+        para: Paragraph to append to
+        text: Run text
+        size: Font size (defaults to 10pt)
+        bold: Make the run bold
+        color: Optional RGBColor for the text
+
+    Returns:
+        The new run
+    """
+    run = para.add_run(text)
+    font = run.font
+    font.size = size or _PT10
+    if bold:
+        font.bold = True
+    if color is not None:
+        font.color.rgb = color
+    return run
 
 
-def generate_docx_cover_letter(markdown_text: str, output_path: Path) -> Path:
+def _bullet_adder(doc: Document, size) -> Callable[[str], None]:
+    """
+    Return a function that appends 'List Bullet' paragraphs to doc.
+
+    The first bullet goes through python-docx; later ones are copies of its
+    XML with the text swapped in, skipping the style lookup and the
+    Paragraph/Run wrappers that add_paragraph builds for every bullet.
+
+    Args:
+        doc: Document to append to
+        size: Font size of the bullet text
+    """
+    body = doc.element.body
+    prototype = None
+
+    def add_bullet(text: str):
+        nonlocal prototype
+        if prototype is None:
+            para = doc.add_paragraph(style='List Bullet')
+            _styled_run(para, '', size)
+            p = para._p
+            prototype = copy.deepcopy(p)
+        else:
+            p = copy.deepcopy(prototype)
+            sect_pr = body.sectPr
+            if sect_pr is not None:
+                sect_pr.addprevious(p)  # Body content must precede sectPr
+            else:
+                body.append(p)
+        # Same text handling as add_run (tabs, line breaks, xml:space)
+        p.r_lst[0].text = text
+
+    return add_bullet
+
+
+def generate_docx_cover_letter(
+    markdown_text: str,
+    output_path: Union[Path, BinaryIO]
+) -> Union[Path, BinaryIO]:
     """
     Generate ATS-friendly Word document cover letter from markdown.
 
     Args:
         markdown_text: Markdown formatted cover letter text
-        output_path: Path to save .docx file
+        output_path: Path to save .docx file, or a writable binary file
+            object (e.g. io.BytesIO) to write it to instead
 
     Returns:
-        Path to generated .docx file
+        output_path
     """
     if not DOCX_AVAILABLE:
         raise ImportError("python-docx is required. Install with: pip install python-docx")
 
-    doc = Document()
+    doc = _new_doc()
 
     # Set document margins
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Inches(1.0)
-        section.bottom_margin = Inches(1.0)
-        section.left_margin = Inches(1.0)
-        section.right_margin = Inches(1.0)
+    # A new Document has exactly one section
+    section = doc.sections[0]
+    section.top_margin = section.bottom_margin = _ONE_IN
+    section.left_margin = section.right_margin = _ONE_IN
+
+    add_bullet = _bullet_adder(doc, _PT11)
 
     # Parse the markdown text
     lines = markdown_text.split('\n')
 
+    prev_blank = False
     for i, line in enumerate(lines):
         line_stripped = line.strip()
 
-        # Skip empty lines (but add spacing)
+        # Skip empty lines (but add spacing, one spacer per run of blanks)
         if not line_stripped:
-            if i > 0:  # Don't add space at the beginning
+            if i > 0 and not prev_blank:  # Don't add space at the beginning
                 doc.add_paragraph()
+                prev_blank = True
             continue
+        prev_blank = False
+
+        kind = _cover_line_kind(line_stripped)
 
         # Headers (##)
-        if line_stripped.startswith('## '):
+        if kind == 'header':
             header_text = line_stripped.replace('## ', '')
-            para = doc.add_paragraph()
-            run = para.add_run(header_text)
-            run.font.size = Pt(12)
-            run.font.bold = True
-            run.font.color.rgb = RGBColor(37, 99, 235)  # Blue accent
+            _styled_run(doc.add_paragraph(), header_text, _PT12, bold=True, color=_BLUE)
             continue
 
         # Bold text (**text**)
-        if '**' in line_stripped:
+        if kind == 'bold':
             para = doc.add_paragraph()
             # Simple bold handling
             parts = line_stripped.split('**')
             for j, part in enumerate(parts):
-                run = para.add_run(part)
-                if j % 2 == 1:  # Odd indices are bold
-                    run.font.bold = True
-                run.font.size = Pt(11)
+                # Odd indices are bold
+                _styled_run(para, part, _PT11, bold=j % 2 == 1)
             continue
 
         # Bullet points (lines starting with -)
-        if line_stripped.startswith('- '):
+        if kind == 'bullet':
             text = line_stripped[2:]  # Remove '- '
-            para = doc.add_paragraph(text, style='List Bullet')
-            para.runs[0].font.size = Pt(11)
+            add_bullet(text)
             continue
 
         # Regular paragraphs
-        para = doc.add_paragraph(line_stripped)
-        para.runs[0].font.size = Pt(11)
+        _styled_run(doc.add_paragraph(), line_stripped, _PT11)
 
     # Save the document
-    doc.save(str(output_path))
+    doc.save(output_path)
     return output_path
+
+
+def generate_many(
+    jobs: List[Tuple[Dict[str, Any], Union[Path, BinaryIO]]],
+    max_workers: int = 4
+) -> List[Union[Path, BinaryIO]]:
+    """
+    Generate several resumes, in parallel when the batch is large enough.
+
+    Threads only overlap the file writes; building each document is
+    GIL-bound. Batches smaller than max_workers run sequentially, where
+    pool startup would cost more than it saves.
+
+    Args:
+        jobs: (resume_data, output_path) pairs for generate_docx_resume
+        max_workers: Maximum number of worker threads
+
+    Returns:
+        The output paths (or file objects), in the same order as jobs
+    """
+    if len(jobs) < max_workers:
+        return [generate_docx_resume(data, path) for data, path in jobs]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda job: generate_docx_resume(*job), jobs))
@@ -16,7 +16,7 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
-from career_data_manager import CareerDataManager, CareerDataError
+from career_data_manager import CareerDataManager, CareerDataError, CareerDataValidationError
 from models import CareerData, ContactInfo, Job, Skill, Achievement
 
 
@@ -157,6 +157,37 @@ class TestCareerDataManager:
         loaded2 = manager.load()
         assert loaded2.contact_info.name == "Modified"
 
+    def test_stat_ttl_skips_mtime_check(self, temp_dir):
+        """Test that stat_ttl trusts the cache without re-checking the file."""
+        manager = CareerDataManager(temp_dir / "ttl_career_data.json", stat_ttl=60.0)
+
+        contact = ContactInfo(
+            name="TTL User",
+            email="ttl@example.com",
+            phone="123-456-7890"
+        )
+
+        data = CareerData(
+            contact_info=contact,
+            jobs=[],
+            skills=[],
+            education=[],
+            certifications=[],
+            projects=[],
+            personal_values=[]
+        )
+
+        manager.save(data)
+        loaded1 = manager.load()
+
+        # External edit within the TTL is not picked up
+        manager.file_path.write_text(manager.file_path.read_text().replace("TTL User", "Edited"))
+        assert manager.load() is loaded1
+
+        # Until the cache is invalidated
+        manager.invalidate_cache()
+        assert manager.load().contact_info.name == "Edited"
+
     def test_backup_created(self, manager):
         """Test that backup file is created before save."""
         # Create and save initial data
@@ -221,6 +252,89 @@ class TestCareerDataManager:
         temp_path = manager.file_path.with_suffix('.tmp')
         assert not temp_path.exists()
 
+    def test_invalid_edit_rejected_before_write(self, manager):
+        """Test that in-place edits are validated on save and disk is untouched."""
+        contact = ContactInfo(
+            name="Valid User",
+            email="valid@example.com",
+            phone="123-456-7890"
+        )
+
+        data = CareerData(
+            contact_info=contact,
+            jobs=[],
+            skills=[],
+            education=[],
+            certifications=[],
+            projects=[],
+            personal_values=[]
+        )
+
+        manager.save(data)
+        original_content = manager.file_path.read_bytes()
+
+        # Mutate in place (bypasses Pydantic field validators)
+        data.contact_info.email = "no-at-sign"
+
+        with pytest.raises(CareerDataValidationError):
+            manager.save(data)
+
+        # File on disk should be unchanged
+        assert manager.file_path.read_bytes() == original_content
+
+    def test_unserializable_edit_rejected_before_write(self, manager):
+        """Test that serialization errors are wrapped and disk is untouched."""
+        contact = ContactInfo(
+            name="Valid User",
+            email="valid@example.com",
+            phone="123-456-7890"
+        )
+        data = CareerData(contact_info=contact)
+
+        manager.save(data)
+        original_content = manager.file_path.read_bytes()
+
+        # Not JSON-serializable; list appends bypass validation
+        data.skipped_skills.append(object())
+
+        with pytest.raises(CareerDataError):
+            manager.save(data)
+
+        assert manager.file_path.read_bytes() == original_content
+
+    def test_unchanged_save_skips_write(self, manager):
+        """Test that re-saving identical data doesn't rewrite the file."""
+        contact = ContactInfo(
+            name="Unchanged User",
+            email="same@example.com",
+            phone="123-456-7890"
+        )
+
+        data = CareerData(
+            contact_info=contact,
+            jobs=[],
+            skills=[],
+            education=[],
+            certifications=[],
+            projects=[],
+            personal_values=[]
+        )
+
+        manager.save(data)
+        first_stat = manager.file_path.stat()
+
+        # Same content - file (and last_updated) left alone
+        assert manager.save(data) == True
+        second_stat = manager.file_path.stat()
+        assert second_stat.st_ino == first_stat.st_ino
+        assert second_stat.st_mtime_ns == first_stat.st_mtime_ns
+
+        # Changed content - written again
+        data.contact_info.name = "Changed User"
+        manager.save(data)
+        assert manager.file_path.stat().st_ino != first_stat.st_ino
+        assert json.loads(manager.file_path.read_text())['contact_info']['name'] == "Changed User"
+
 
 # Run tests
 if __name__ == '__main__':
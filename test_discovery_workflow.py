@@ -88,6 +88,35 @@ def test_skill_detection():
     print("\n[PASS] Skill detection working")
 
 
+def test_multi_word_skill_detection():
+    """Test multi-word and slash-joined skills are found in one pass."""
+    print("\n" + "=" * 70)
+    print("TEST 1b: Multi-Word Skill Detection")
+    print("=" * 70)
+
+    career_data = CareerData(
+        contact_info=ContactInfo(
+            name="Test User",
+            email="test@example.com",
+            phone="123-456-7890"
+        )
+    )
+
+    job_description = """
+    - A/B testing with Google Analytics and Power BI dashboards
+    - CI with GitHub Actions
+    - Agile/Scrum ceremonies, Jira and Confluence
+    """
+
+    detected = SkillDetector().detect_missing_skills(job_description, career_data, max_skills=20)
+    print(f"  Detected: {detected}")
+
+    for expected in ["A/B Testing", "Google Analytics", "Power Bi", "Github Actions",
+                     "Agile", "Scrum", "Jira", "Confluence"]:
+        assert expected in detected
+    print("\n[PASS] Multi-word skills detected")
+
+
 def test_consistency_validation():
     """Test consistency validation against career data."""
     print("\n" + "=" * 70)
@@ -173,6 +202,14 @@ def test_consistency_validation():
     assert any("not in your job history" in w for w in result_unknown['warnings'])
     print("  [PASS] Company warning generated")
 
+    # Test 4: Batch validation matches one-at-a-time results
+    print("\n[4] Testing batch validation...")
+    batch = [discovered, discovered_bad, discovered_unknown]
+    results = validator.validate_many(batch)
+
+    assert results == [validator.validate(d) for d in batch]
+    print("  [PASS] Batch results match individual validation")
+
     print("\n[PASS] Consistency validation working")
 
 
@@ -277,6 +314,7 @@ def run_all_tests():
 
     try:
         test_skill_detection()
+        test_multi_word_skill_detection()
         test_consistency_validation()
         test_hallucination_detection()
         test_copy_paste_detection()
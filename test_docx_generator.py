@@ -0,0 +1,43 @@
+"""
+Unit tests for docx_generator module.
+
+Tests cover:
+- Batch generation order and output validity
+"""
+
+import pytest
+
+docx = pytest.importorskip("docx")
+
+from docx_generator import generate_many
+
+
+def _resume(index: int) -> dict:
+    return {
+        'title': f'Product Manager {index}',
+        'summary': f'Summary for resume {index}.',
+        'experience': [{
+            'company': f'Company {index}',
+            'title': 'Senior Product Manager',
+            'dates': '01/2020 - Present',
+            'bullets': [f'Shipped feature {index}', 'Grew engagement 40%'],
+        }],
+        'skills': ['Roadmapping', 'SQL'],
+    }
+
+
+class TestGenerateMany:
+    """Test suite for generate_many."""
+
+    @pytest.mark.parametrize("count", [2, 6])
+    def test_returns_paths_in_input_order(self, tmp_path, count):
+        """Both the sequential and threaded paths keep input order."""
+        jobs = [(_resume(i), tmp_path / f"resume_{i}.docx") for i in range(count)]
+
+        result = generate_many(jobs, max_workers=4)
+
+        assert result == [path for _, path in jobs]
+        for i, path in enumerate(result):
+            doc = docx.Document(path)
+            text = '\n'.join(p.text for p in doc.paragraphs)
+            assert f'Company {i} | ' in text
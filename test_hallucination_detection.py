@@ -203,6 +203,44 @@ class TestConflictDetection:
         assert len(conflicts) > 0
         assert any("date" in c.field.lower() for c in conflicts)
 
+    @staticmethod
+    def _overlap(existing_dates: str, new_dates: str):
+        """Run the date overlap check of a new job against one existing job."""
+        detector = ConflictDetector({
+            "job_history": [{"company": "Acme", "dates": existing_dates}]
+        })
+        return detector._check_date_overlap({"company": "Beta", "dates": new_dates})
+
+    def test_detects_date_overlap(self):
+        """Flag jobs at different companies with overlapping dates."""
+        conflict = self._overlap("01/2020 - 06/2022", "01/2021 - 12/2021")
+
+        assert conflict is not None
+        assert conflict.conflict_type == "Date Overlap"
+        assert conflict.severity == "high"
+
+    def test_allows_month_handover(self):
+        """One job ending the month the next starts is not an overlap."""
+        assert self._overlap("01/2020 - 06/2022", "06/2022 - Present") is None
+
+    def test_allows_year_handover(self):
+        """Bare-year ranges sharing a boundary year are not an overlap."""
+        assert self._overlap("2020 - 2022", "2022 - Present") is None
+        assert self._overlap("2020 - 2022", "06/2022 - Present") is None
+
+    def test_allows_separate_dates(self):
+        """No conflict when the date ranges don't touch."""
+        assert self._overlap("2020 - 2022", "2023 - 2024") is None
+
+    def test_ignores_unparseable_dates(self):
+        """Ranges that can't be parsed are skipped, not flagged."""
+        assert self._overlap("2020 - 2022", "sometime - later") is None
+        assert self._overlap("a while ago", "2021 - 2022") is None
+
+    def test_detects_two_current_jobs(self):
+        """Two open-ended jobs overlap."""
+        assert self._overlap("2021 - Present", "01/2023 - Present") is not None
+
     def test_detects_metric_mismatch(self):
         """Detect when same achievement has different metrics."""
         detector = ConflictDetector(CAREER_DATA)